@@ -8,6 +8,7 @@ from waitress import serve
 from core import get_state_manager, StateEvent
 from pipeline.message_pipeline import MessagePipeline, ProcessingError
 from utils.message_dump_manager import get_dump_manager
+from utils.response_utils import format_streaming_chunk
 from functools import wraps
 import time
 
@@ -1396,13 +1397,7 @@ def create_response_jsonify(text: str, pipeline: MessagePipeline, model: str = "
 
 def create_response_streaming(text: str, pipeline: MessagePipeline, model: str = "intense-rp-next-1") -> str:
     """Create streaming response chunk"""
-    return "data: " + json.dumps({
-        "id": "chatcmpl-intenserp",
-        "object": "chat.completion.chunk",
-        "created": int(time.time() * 1000),
-        "model": model,
-        "choices": [{"index": 0, "delta": {"content": text}}]
-    }) + "\n\n"
+    return format_streaming_chunk(text, model)
 
 def create_response(text: str, streaming: bool, pipeline: MessagePipeline, model: str = "intense-rp-next-1") -> Response:
     """Create appropriate response based on streaming setting"""
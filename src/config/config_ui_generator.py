@@ -617,6 +617,9 @@ class ConfigUIGenerator:
                 # Apply console settings immediately after saving
                 self._apply_console_settings_after_save()
                 
+                # Let a running refresh timer pick up its new settings
+                self._apply_refresh_timer_settings_after_save()
+                
                 # Clear reference to this UI generator
                 self._clear_ui_generator_reference()
                 
@@ -642,6 +645,15 @@ class ConfigUIGenerator:
         except Exception as e:
             print(f"Error applying console settings after save: {e}")
     
+    def _apply_refresh_timer_settings_after_save(self) -> None:
+        """Apply refresh timer settings immediately after saving configuration"""
+        try:
+            from utils.refresh_timer import reload_refresh_timer_config
+            
+            reload_refresh_timer_config()
+        except Exception as e:
+            print(f"Error applying refresh timer settings after save: {e}")
+    
     def _clear_ui_generator_reference(self) -> None:
         """Clear reference to this UI generator from state manager"""
         try:
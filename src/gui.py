@@ -1,9 +1,9 @@
-import threading, webbrowser, api, sys, os, re, platform, tkinter as tk
+import threading, webbrowser, api, sys, os, re, platform
 import utils.response_utils as response_utils
 import utils.deepseek_driver as deepseek
 import utils.process_manager as process
 import utils.gui_builder as gui_builder
-from utils.gui_builder import ContributorWindow, WelcomeWindow
+from utils.gui_builder import ContributorWindow, WelcomeWindow, make_window_modal
 from utils.welcome_utils import WelcomeManager
 import utils.console_manager as console_manager
 import utils.webdriver_utils as selenium
@@ -23,67 +23,6 @@ storage_manager = None
 config_manager = None
 icon_path = None
 
-# =============================================================================================================================
-# Modal Window Management
-# =============================================================================================================================
-
-def make_window_modal(window, parent_window):
-    """
-    Make a window modal in a cross-platform way that preserves Mica effect on Windows 11.
-    On Windows, we avoid using transient() to preserve the Mica backdrop effect.
-    """
-    is_windows = platform.system() == "Windows"
-    
-    if not is_windows:
-        # On non-Windows platforms, use traditional transient approach
-        window.transient(parent_window)
-        window.grab_set()
-    else:
-        # On Windows, we use alternative approach to preserve Mica effect
-        # This makes the window always on top and handle focus manually
-        window.attributes("-topmost", True)
-        window.grab_set()
-        
-        # Bind focus events to maintain modal behavior
-        def on_parent_focus(_event=None):
-            if window.winfo_exists():
-                window.focus_force()
-                window.lift()
-        
-        binding_id = parent_window.bind("<FocusIn>", on_parent_focus)
-        
-        # Store the binding ID and parent for cleanup
-        setattr(window, '_parent_focus_binding_id', binding_id)
-        setattr(window, '_parent_window', parent_window)
-
-        # UNFORTUNATELY, this also means that all of the normal built-in modal behaviors
-        # ... now must be written manually. Tell Microsoft I want to have my cake and eat it too.
-        #                                                                           - Lyubomir
-        #
-        #
-        # If you're reading this, it's likely I've been hunted down by Microsoft for this comment.
-        
-        # Override destroy to clean up bindings
-        original_destroy = window.destroy
-        def cleanup_and_destroy():
-            try:
-                if hasattr(window, '_parent_window') and hasattr(window, '_parent_focus_binding_id'):
-                    parent = getattr(window, '_parent_window')
-                    binding_id = getattr(window, '_parent_focus_binding_id')
-                    
-                    if parent.winfo_exists():
-                        parent.unbind("<FocusIn>", binding_id)
-            except (AttributeError, tk.TclError):
-                pass
-            finally:
-                original_destroy()
-        
-        window.destroy = cleanup_and_destroy
-    
-    # Common modal setup
-    window.focus_force()
-    window.lift()
-
 # =============================================================================================================================
 # Console Window
 # =============================================================================================================================
@@ -522,7 +461,7 @@ def create_gui() -> None:
 
         # Configure external dependencies
         deepseek.manager = storage_manager
-        response_utils.__version__ = __version__
+        response_utils.set_version(__version__)
         
         gui_builder.apply_appearance()
         root = gui_builder.RootWindow()
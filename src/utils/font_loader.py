@@ -5,6 +5,7 @@ Handles loading custom TTF fonts with fallback to system fonts
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Tuple, Union
 import logging
@@ -258,11 +259,15 @@ def get_font_loader() -> FontLoader:
     return _font_loader
 
 
+@lru_cache(maxsize=64)
 def get_font_tuple(family: str = "Blinker", size: int = 12, 
                   weight: str = "normal") -> Tuple[str, int, ...]:
     """
     Convenience function to get font tuple with Blinker primary and Arial fallback
     
+    Results are memoized: fonts are loaded once per process, and the fallback
+    path otherwise enumerates every system font family on each call.
+    
     Args:
         family: Preferred font family (default: "Blinker")
         size: Font size
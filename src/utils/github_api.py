@@ -27,6 +27,7 @@ class GitHubAsset:
     is_current_platform: bool = False
     friendly_name: str = ""
     description: str = ""
+    digest: str = ""  # e.g. "sha256:<hex>", when GitHub provides one
 
 
 class GitHubAPI:
@@ -81,7 +82,8 @@ class GitHubAPI:
                 size=asset_data['size'],
                 content_type=asset_data.get('content_type', ''),
                 created_at=asset_data['created_at'],
-                download_count=asset_data['download_count']
+                download_count=asset_data['download_count'],
+                digest=asset_data.get('digest') or ''
             )
             
             # Enhance asset with metadata
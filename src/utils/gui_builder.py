@@ -6,12 +6,32 @@ import webbrowser
 import os
 import sys
 import platform
+import subprocess
+import tkinter as tk
+from tkinter import messagebox
 from utils.font_loader import get_font_tuple
 from utils import storage_manager
+from utils.updater_manager import UpdaterManager
 from PIL import Image, ImageDraw
 import requests
+from requests.adapters import HTTPAdapter
 from io import BytesIO
 import threading
+import time
+import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+
+# Integrated download tuning
+_KB = 1 << 10
+_MB = 1 << 20
+_GB = 1 << 30
+_DOWNLOAD_BUFFER_SIZE = 256 * _KB  # Bytes requested per readinto() call
+_SPEED_UNITS = ((_GB, "GB/s"), (_MB, "MB/s"), (_KB, "KB/s"))  # Largest first
+_PERMISSION_CHECK_TIMEOUT = 5.0  # Seconds to wait for the background updater permission check
+
+_SYSTEM = platform.system()  # Doesn't change while running, so resolve it once
 
 # ============================================================================================================================
 # Cross-Platform GUI Utilities
@@ -85,6 +105,103 @@ def set_window_icon(window, icon_path: Optional[str]) -> None:
     except Exception as e:
         print(f"Could not set window icon: {e}")
 
+# =============================================================================================================================
+# Modal Window Management
+# =============================================================================================================================
+
+def make_window_modal(window, parent_window):
+    """
+    Make a window modal in a cross-platform way that preserves Mica effect on Windows 11.
+    On Windows, we avoid using transient() to preserve the Mica backdrop effect.
+    Can be called again on a window after release_window_modal() to restore its modality.
+    """
+    is_windows = _SYSTEM == "Windows"
+    
+    # Remember the parent so modality can be released and handed over later
+    setattr(window, '_modal_parent', parent_window)
+    
+    if not is_windows:
+        # On non-Windows platforms, use traditional transient approach
+        window.transient(parent_window)
+        window.grab_set()
+    else:
+        # On Windows, we use alternative approach to preserve Mica effect
+        # This makes the window always on top and handle focus manually
+        window.attributes("-topmost", True)
+        window.grab_set()
+        
+        # Bind focus events to maintain modal behavior
+        def on_parent_focus(_event=None):
+            if window.winfo_exists():
+                window.focus_force()
+                window.lift()
+        
+        binding_id = parent_window.bind("<FocusIn>", on_parent_focus)
+        
+        # Store the binding ID and parent for cleanup
+        setattr(window, '_parent_focus_binding_id', binding_id)
+        setattr(window, '_parent_window', parent_window)
+
+        # UNFORTUNATELY, this also means that all of the normal built-in modal behaviors
+        # ... now must be written manually. Tell Microsoft I want to have my cake and eat it too.
+        #                                                                           - Lyubomir
+        #
+        #
+        # If you're reading this, it's likely I've been hunted down by Microsoft for this comment.
+        
+        # Override destroy to clean up bindings (only once, the window may be made modal again)
+        if not getattr(window, '_modal_destroy_wrapped', False):
+            original_destroy = window.destroy
+            def cleanup_and_destroy():
+                try:
+                    _unbind_parent_focus(window)
+                finally:
+                    original_destroy()
+            
+            window.destroy = cleanup_and_destroy
+            setattr(window, '_modal_destroy_wrapped', True)
+    
+    # Common modal setup
+    window.focus_force()
+    window.lift()
+
+def _unbind_parent_focus(window) -> None:
+    """Remove the parent <FocusIn> binding make_window_modal added on Windows, if any"""
+    parent = getattr(window, '_parent_window', None)
+    binding_id = getattr(window, '_parent_focus_binding_id', None)
+    # Clear first, unbind() with no id would drop every <FocusIn> binding on the parent
+    setattr(window, '_parent_focus_binding_id', None)
+    if parent is None or binding_id is None:
+        return
+    try:
+        if parent.winfo_exists():
+            parent.unbind("<FocusIn>", binding_id)
+    except (AttributeError, tk.TclError):
+        pass
+
+def release_window_modal(window):
+    """
+    Release the modality make_window_modal set up, e.g. before hiding the window.
+    Tk only drops a grab when the window is destroyed, a withdrawn window would keep it.
+    
+    Args:
+        window: Window that may have been made modal
+        
+    Returns:
+        The parent the window was modal to, or None if it wasn't modal
+    """
+    parent_window = getattr(window, '_modal_parent', None)
+    if parent_window is None:
+        return None
+    
+    setattr(window, '_modal_parent', None)
+    try:
+        window.grab_release()
+    except tk.TclError:
+        pass
+    _unbind_parent_focus(window)
+    return parent_window
+
 # =============================================================================================================================
 # Simple Tooltip Implementation
 # =============================================================================================================================
@@ -1433,6 +1550,52 @@ class ContributorWindow(ctk.CTkToplevel):
 # Better Update System Windows
 # =============================================================================================================================
 
+# Runs the update windows' background release lookups, one at a time
+_background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="update-worker")
+# The updater permission check gets its own worker, so a slow release fetch can't hold it past its timeout
+_permission_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="permission-check")
+
+# Latest release data, fetched in the background as soon as the update prompt opens
+_release_future: Optional[Future] = None
+
+def _prefetch_latest_release() -> None:
+    """Start fetching the latest GitHub release in the background if not already in flight"""
+    global _release_future
+    if _release_future is not None:
+        return
+    
+    from .github_api import GitHubAPI
+    _release_future = _background_executor.submit(GitHubAPI.get_latest_release)
+
+@lru_cache(maxsize=1)
+def _downloads_dir() -> Path:
+    """Resolve (and create once) the folder integrated downloads are saved to"""
+    # Try to get user's Downloads folder, fallback to current directory
+    try:
+        downloads_dir = Path.home() / "Downloads" / "IntenseRP"
+        downloads_dir.mkdir(parents=True, exist_ok=True)
+    except:
+        # Fallback to current directory if Downloads folder not accessible
+        downloads_dir = Path.cwd() / "Downloads"
+        downloads_dir.mkdir(exist_ok=True)
+    return downloads_dir
+
+def _get_prefetched_release(timeout: float = 15) -> Optional[dict]:
+    """Return the prefetched release data, or None if it was never started or failed"""
+    global _release_future
+    if _release_future is None:
+        return None
+    
+    try:
+        release_data = _release_future.result(timeout=timeout)
+    except Exception:
+        release_data = None
+    
+    if not release_data:
+        # Don't keep a failed result around, let the next attempt refetch
+        _release_future = None
+    return release_data
+
 class BetterUpdateWindow(ctk.CTkToplevel):
     """Better update notification window with improved styling"""
     
@@ -1441,6 +1604,8 @@ class BetterUpdateWindow(ctk.CTkToplevel):
         self.parent = parent
         self.version = version
         self.icon_path = icon_path
+        # Fetch release assets while the user reads the prompt
+        _prefetch_latest_release()
         self._create_window()
         self._create_widgets()
         if self.icon_path:
@@ -1449,7 +1614,8 @@ class BetterUpdateWindow(ctk.CTkToplevel):
     def _create_window(self):
         """Set up the window properties"""
         self.title("New Version Available")
-        self.geometry("400x200")
+        self._window_width, self._window_height = 400, 200
+        self.geometry(f"{self._window_width}x{self._window_height}")
         self.resizable(False, False)
         self.attributes("-topmost", True)
         
@@ -1505,28 +1671,36 @@ class BetterUpdateWindow(ctk.CTkToplevel):
     
     def _on_download_click(self):
         """Handle download button click"""
-        self.destroy()
+        # Hide instead of destroying so "Back" can bring this window back instantly.
+        # A hidden window keeps its grab, so hand the modality over to the next window.
+        modal_parent = release_window_modal(self)
+        self.withdraw()
         # Create and show download options window
-        download_options_window = DownloadOptionsWindow(self.parent, self.version, self.icon_path)
+        download_options_window = DownloadOptionsWindow(self.parent, self.version, self.icon_path, previous_window=self)
+        if modal_parent is not None:
+            make_window_modal(download_options_window, modal_parent)
         download_options_window.center()
     
     def center(self):
         """Center the window relative to parent"""
-        self.update_idletasks()
         if self.parent:
-            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (self.winfo_width() // 2)
-            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (self.winfo_height() // 2)
+            # Use the known window size instead of flushing idle tasks to measure it
+            width = self._apply_window_scaling(self._window_width)
+            height = self._apply_window_scaling(self._window_height)
+            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (width // 2)
+            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (height // 2)
             self.geometry(f"+{x}+{y}")
 
 
 class DownloadOptionsWindow(ctk.CTkToplevel):
     """Window for choosing download method"""
     
-    def __init__(self, parent, version: str, icon_path: Optional[str] = None):
+    def __init__(self, parent, version: str, icon_path: Optional[str] = None, previous_window: Optional[ctk.CTkToplevel] = None):
         super().__init__(parent)
         self.parent = parent
         self.version = version
         self.icon_path = icon_path
+        self.previous_window = previous_window
         self._create_window()
         self._create_widgets()
         if self.icon_path:
@@ -1543,13 +1717,16 @@ class DownloadOptionsWindow(ctk.CTkToplevel):
             
         self.title("Choose Download Method")
         # Make window taller for source builds to accommodate extra widgets
-        height = "400" if is_source_build else "260"
-        self.geometry(f"360x{height}")
+        self._window_width, self._window_height = 360, (400 if is_source_build else 260)
+        self.geometry(f"{self._window_width}x{self._window_height}")
         self.resizable(False, False)
         self.attributes("-topmost", True)
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
+        
+        # Route the title bar close through destroy() so the hidden previous window is cleaned up too
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
     
     def _create_widgets(self):
         """Create and layout all widgets"""
@@ -1686,22 +1863,41 @@ class DownloadOptionsWindow(ctk.CTkToplevel):
     
     def _open_integrated_download(self):
         """Open integrated download window"""
-        self.destroy()
-        asset_selection_window = AssetSelectionWindow(self.parent, self.version, self.icon_path)
+        # A hidden window keeps its grab, so hand the modality over to the next window
+        modal_parent = release_window_modal(self)
+        self.withdraw()
+        asset_selection_window = AssetSelectionWindow(self.parent, self.version, self.icon_path, previous_window=self)
+        if modal_parent is not None:
+            make_window_modal(asset_selection_window, modal_parent)
         asset_selection_window.center()
     
     def _go_back(self):
         """Go back to better update window"""
+        previous_window = self.previous_window
+        self.previous_window = None  # Keep the hidden window alive through destroy()
+        modal_parent = release_window_modal(self)
         self.destroy()
-        better_update_window = BetterUpdateWindow(self.parent, self.version, self.icon_path)
-        better_update_window.center()
+        if previous_window is not None and previous_window.winfo_exists():
+            previous_window.deiconify()
+            if modal_parent is not None:
+                make_window_modal(previous_window, modal_parent)
+            previous_window.lift()
+        else:
+            better_update_window = BetterUpdateWindow(self.parent, self.version, self.icon_path)
+            if modal_parent is not None:
+                make_window_modal(better_update_window, modal_parent)
+            better_update_window.center()
+    
+    def destroy(self):
+        """Destroy this window along with any hidden window it was opened from"""
+        if self.previous_window is not None and self.previous_window.winfo_exists():
+            self.previous_window.destroy()
+        self.previous_window = None
+        super().destroy()
     
     def _open_git_update(self):
         """Open git update instructions dialog"""
         try:
-            import subprocess
-            import platform
-            
             # Check if git is available
             try:
                 subprocess.run(["git", "--version"], capture_output=True, check=True)
@@ -1715,7 +1911,6 @@ class DownloadOptionsWindow(ctk.CTkToplevel):
                 dialog.center()
             else:
                 # Show git not found dialog
-                from tkinter import messagebox
                 messagebox.showwarning(
                     "Git Not Found",
                     "Git is not installed or not available in PATH.\n\n"
@@ -1729,21 +1924,24 @@ class DownloadOptionsWindow(ctk.CTkToplevel):
 
     def center(self):
         """Center the window relative to parent"""
-        self.update_idletasks()
         if self.parent:
-            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (self.winfo_width() // 2)
-            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (self.winfo_height() // 2)
+            # Use the known window size instead of flushing idle tasks to measure it
+            width = self._apply_window_scaling(self._window_width)
+            height = self._apply_window_scaling(self._window_height)
+            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (width // 2)
+            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (height // 2)
             self.geometry(f"+{x}+{y}")
 
 
 class AssetSelectionWindow(ctk.CTkToplevel):
     """Window for selecting which asset to download"""
     
-    def __init__(self, parent, version: str, icon_path: Optional[str] = None):
+    def __init__(self, parent, version: str, icon_path: Optional[str] = None, previous_window: Optional[ctk.CTkToplevel] = None):
         super().__init__(parent)
         self.parent = parent
         self.version = version
         self.icon_path = icon_path
+        self.previous_window = previous_window
         self.selected_asset = None
         self.assets = []
         self.asset_vars = {}
@@ -1755,7 +1953,8 @@ class AssetSelectionWindow(ctk.CTkToplevel):
     def _create_window(self):
         """Set up the window properties"""
         self.title("Select Download")
-        self.geometry("500x400")
+        self._window_width, self._window_height = 500, 400
+        self.geometry(f"{self._window_width}x{self._window_height}")
         self.resizable(True, True)
         self.minsize(450, 350)
         self.attributes("-topmost", True)
@@ -1763,6 +1962,9 @@ class AssetSelectionWindow(ctk.CTkToplevel):
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)  # Make scrollable frame expandable
+        
+        # Route the title bar close through destroy() so the hidden previous window is cleaned up too
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
     
     def _load_assets(self):
         """Load assets from GitHub API and create UI"""
@@ -1791,26 +1993,26 @@ class AssetSelectionWindow(ctk.CTkToplevel):
         try:
             from .github_api import GitHubAPI
             
-            # Get release data
-            release_data = GitHubAPI.get_latest_release()
+            # Get release data, preferring the one prefetched by BetterUpdateWindow
+            release_data = _get_prefetched_release() or GitHubAPI.get_latest_release()
             if not release_data:
-                self.after(0, lambda: self._show_error("Failed to fetch release information."))
+                self.after(0, partial(self._show_error, "Failed to fetch release information."))
                 return
             
             # Get and categorize assets
             assets = GitHubAPI.get_release_assets(release_data)
             if not assets:
-                self.after(0, lambda: self._show_error("No downloadable assets found."))
+                self.after(0, partial(self._show_error, "No downloadable assets found."))
                 return
             
             self.assets = assets
             categorized_assets = GitHubAPI.categorize_assets(assets)
             
             # Update UI on main thread
-            self.after(0, lambda: self._create_asset_ui(loading_label, categorized_assets))
+            self.after(0, partial(self._create_asset_ui, loading_label, categorized_assets))
             
         except Exception as e:
-            self.after(0, lambda: self._show_error(f"Error loading assets: {e}"))
+            self.after(0, partial(self._show_error, f"Error loading assets: {e}"))
     
     def _show_error(self, error_message: str):
         """Show error message"""
@@ -1857,25 +2059,20 @@ class AssetSelectionWindow(ctk.CTkToplevel):
         
         row = 0
         for platform, assets in categorized_assets.items():
-            # Platform header
+            # Platform header (extra top padding separates it from the previous platform)
             platform_label = ctk.CTkLabel(
                 scrollable_frame,
                 text=f"{platform} ({len(assets)} packages)",
                 font=get_font_tuple("Blinker", 16, "bold"),
                 anchor="w"
             )
-            platform_label.grid(row=row, column=0, padx=10, pady=(10, 5), sticky="ew")
+            platform_label.grid(row=row, column=0, padx=10, pady=(20 if row else 10, 5), sticky="ew")
             row += 1
             
             # Assets for this platform
             for asset in assets:
                 self._create_asset_item(scrollable_frame, asset, row)
                 row += 1
-            
-            # Add spacing between platforms
-            spacing_frame = ctk.CTkFrame(scrollable_frame, height=1, fg_color="transparent")
-            spacing_frame.grid(row=row, column=0, pady=5)
-            row += 1
         
         # Button frame
         button_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -1929,24 +2126,9 @@ class AssetSelectionWindow(ctk.CTkToplevel):
             fg_color=("gray94", "gray16") if not asset.is_current_platform else ("#3d8bc7", "#2a3b4a")
         )
         item_frame.grid(row=row, column=0, padx=10, pady=2, sticky="ew")
-        item_frame.grid_columnconfigure(1, weight=1)
+        item_frame.grid_columnconfigure(0, weight=1)
         item_frame.grid_propagate(False)
         
-        # Radio button
-        radio = ctk.CTkRadioButton(
-            item_frame,
-            text="",
-            variable=self.selected_var,
-            value=asset.name,
-            font=get_font_tuple("Blinker", 12)
-        )
-        radio.grid(row=0, column=0, padx=15, pady=10, rowspan=2)
-        
-        # Asset name and info frame
-        info_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-        info_frame.grid(row=0, column=1, padx=(10, 15), pady=8, sticky="ew", rowspan=2)
-        info_frame.grid_columnconfigure(0, weight=1)
-        
         # Friendly name with recommendation badge
         name_text = asset.friendly_name
         if asset.is_updater:
@@ -1954,27 +2136,22 @@ class AssetSelectionWindow(ctk.CTkToplevel):
         if asset.is_current_platform:
             name_text += " - Your Platform"
         
-        name_label = ctk.CTkLabel(
-            info_frame,
-            text=name_text,
-            font=get_font_tuple("Blinker", 14, "bold" if asset.is_updater or asset.is_current_platform else "normal"),
-            anchor="w",
-            text_color=("green", "lightgreen") if asset.is_updater else ("gray10", "gray90")
-        )
-        name_label.grid(row=0, column=0, sticky="ew")
-        
         # Description and size
         size_text = GitHubAPI.format_file_size(asset.size)
         desc_text = f"{asset.description} • {size_text}"
         
-        desc_label = ctk.CTkLabel(
-            info_frame,
-            text=desc_text,
-            font=get_font_tuple("Blinker", 11),
-            anchor="w",
-            text_color=("gray50", "gray70")
+        # The radio button renders name and description itself, so the row needs no extra labels
+        radio = ctk.CTkRadioButton(
+            item_frame,
+            text=f"{name_text}\n{desc_text}",
+            variable=self.selected_var,
+            value=asset.name,
+            font=get_font_tuple("Blinker", 13, "bold" if asset.is_updater or asset.is_current_platform else "normal"),
+            text_color=("green", "lightgreen") if asset.is_updater else ("gray10", "gray90")
         )
-        desc_label.grid(row=1, column=0, sticky="ew")
+        radio.grid(row=0, column=0, padx=15, pady=10, sticky="w")
+        if hasattr(radio, '_text_label'):
+            radio._text_label.configure(justify="left")
         
         # Pre-select current platform updater if available
         if asset.is_current_platform and asset.is_updater and not self.selected_var.get():
@@ -2005,16 +2182,36 @@ class AssetSelectionWindow(ctk.CTkToplevel):
     
     def _go_back(self):
         """Go back to download options window"""
+        previous_window = self.previous_window
+        self.previous_window = None  # Keep the hidden window alive through destroy()
+        modal_parent = release_window_modal(self)
         self.destroy()
-        download_options_window = DownloadOptionsWindow(self.parent, self.version, self.icon_path)
-        download_options_window.center()
+        if previous_window is not None and previous_window.winfo_exists():
+            previous_window.deiconify()
+            if modal_parent is not None:
+                make_window_modal(previous_window, modal_parent)
+            previous_window.lift()
+        else:
+            download_options_window = DownloadOptionsWindow(self.parent, self.version, self.icon_path)
+            if modal_parent is not None:
+                make_window_modal(download_options_window, modal_parent)
+            download_options_window.center()
+    
+    def destroy(self):
+        """Destroy this window along with any hidden window it was opened from"""
+        if self.previous_window is not None and self.previous_window.winfo_exists():
+            self.previous_window.destroy()
+        self.previous_window = None
+        super().destroy()
     
     def center(self):
         """Center the window relative to parent"""
-        self.update_idletasks()
         if self.parent:
-            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (self.winfo_width() // 2)
-            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (self.winfo_height() // 2)
+            # Use the known window size instead of flushing idle tasks to measure it
+            width = self._apply_window_scaling(self._window_width)
+            height = self._apply_window_scaling(self._window_height)
+            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (width // 2)
+            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (height // 2)
             self.geometry(f"+{x}+{y}")
 
 
@@ -2027,18 +2224,45 @@ class DownloadProgressWindow(ctk.CTkToplevel):
         self.asset = asset
         self.icon_path = icon_path
         self.download_cancelled = False
+        self.download_finished = False
+        self._progress_state = None  # Latest (progress, percentage, speed) published by the download thread
+        self._shown_percentage = 0  # What the progress widgets currently display
+        self._shown_speed = "0 KB/s"
+        self._cancel_shown = False
+        self._permission_future: Optional[Future] = None
+        # Pending after() ids of the recurring polls, cancelled when the window is destroyed
+        self._poll_after_id = None
+        self._permission_after_id = None
         self._create_window()
         self._create_widgets()
         if self.icon_path:
             self.after(300, lambda: set_window_icon(self, self.icon_path))
         
+        # Check updater permissions while the file downloads, not after
+        if self.asset.is_updater and self.asset.is_current_platform:
+            self._start_permission_check()
+        
         # Start download in background thread
         threading.Thread(target=self._start_download, daemon=True).start()
+        
+        # Pull progress from the main thread instead of queueing an event per update
+        self._poll_after_id = self.after(100, self._poll_progress)
+    
+    def _start_permission_check(self):
+        """Run the updater permission probe in the background"""
+        self._permission_future = _permission_executor.submit(self._check_permissions)
+    
+    @staticmethod
+    def _check_permissions():
+        """Probe updater permissions, returns the storage manager along with the result"""
+        storage_mgr = storage_manager.StorageManager()
+        return storage_mgr, UpdaterManager.verify_updater_permissions(storage_mgr)
     
     def _create_window(self):
         """Set up the window properties"""
         self.title("Downloading...")
-        self.geometry("450x200")
+        self._window_width, self._window_height = 450, 200
+        self.geometry(f"{self._window_width}x{self._window_height}")
         self.resizable(False, False)
         self.attributes("-topmost", True)
         
@@ -2051,12 +2275,12 @@ class DownloadProgressWindow(ctk.CTkToplevel):
     def _create_widgets(self):
         """Create and layout all widgets"""
         # Title
-        title_label = ctk.CTkLabel(
+        self.title_label = ctk.CTkLabel(
             self,
             text="Downloading Update",
             font=get_font_tuple("Blinker", 18, "bold")
         )
-        title_label.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="ew")
+        self.title_label.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="ew")
         
         # File name
         self.filename_label = ctk.CTkLabel(
@@ -2112,106 +2336,162 @@ class DownloadProgressWindow(ctk.CTkToplevel):
             width=100
         )
         # Don't grid initially - will be shown after a delay
+        
+        # Status and info messages, reused across state changes (hidden until needed)
+        self.status_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=get_font_tuple("Blinker", 12)
+        )
+        self.status_label.grid(row=4, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.status_label.grid_remove()
+        
+        self.info_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=get_font_tuple("Blinker", 11),
+            text_color=("gray50", "gray70")
+        )
+        self.info_label.grid(row=5, column=0, padx=20, pady=(5, 10), sticky="ew")
+        self.info_label.grid_remove()
     
     def _start_download(self):
         """Start the download process"""
-        import tempfile
-        import time
-        
         try:
             # Create persistent download location in user's Downloads folder
-            import os
-            from pathlib import Path
-            
-            # Try to get user's Downloads folder, fallback to current directory
-            try:
-                downloads_dir = Path.home() / "Downloads" / "IntenseRP"
-                downloads_dir.mkdir(parents=True, exist_ok=True)
-            except:
-                # Fallback to current directory if Downloads folder not accessible
-                downloads_dir = Path.cwd() / "Downloads"
-                downloads_dir.mkdir(exist_ok=True)
-            
-            download_path = downloads_dir / self.asset.name
+            download_path = _downloads_dir() / self.asset.name
             self.final_download_path = str(download_path)  # Store for "Open Folder" button
             
             # Speed tracking variables
-            start_time = time.time()
+            start_time = time.monotonic()
             last_update_time = start_time
             last_downloaded = 0
             
-            # Import requests for download
-            import requests
-            
             # Download with progress tracking (simplified like intenserp_updater)
-            response = requests.get(self.asset.download_url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded_size = 0
-            
-            with open(str(download_path), 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if self.download_cancelled:
-                        break
+            # A single-connection session is all a one-file download needs
+            with requests.Session() as session:
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                
+                with session.get(self.asset.download_url, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    
+                    total_size = int(response.headers.get('content-length', 0))
+                    downloaded_size = 0
                     
-                    if chunk:
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
+                    # Read the urllib3 response in 256 KiB blocks rather than 8 KiB chunks, so the loop
+                    # runs far fewer times. urllib3's readinto() still reads into a temporary bytes object
+                    # and copies it over, this only saves the per-chunk Python overhead
+                    buffer = memoryview(bytearray(_DOWNLOAD_BUFFER_SIZE))
+                    raw = response.raw
+                    raw.decode_content = True
+                    
+                    # Verify against GitHub's published digest while streaming, not by re-reading the file
+                    expected_sha256 = None
+                    hasher = None
+                    if self.asset.digest.startswith("sha256:"):
+                        expected_sha256 = self.asset.digest[len("sha256:"):].lower()
+                        hasher = hashlib.sha256()
+                    
+                    with open(str(download_path), 'wb') as f:
+                        # Reserve the whole file up front where supported so writes don't keep growing it
+                        if total_size > 0 and hasattr(os, 'posix_fallocate'):
+                            try:
+                                os.posix_fallocate(f.fileno(), 0, total_size)
+                            except OSError:
+                                pass
                         
-                        # Update progress (like intenserp_updater - simple approach)
-                        if total_size > 0:
-                            current_time = time.time()
-                            
-                            # Only update UI every 0.5 seconds to avoid flooding
-                            if current_time - last_update_time >= 0.5:
-                                # Calculate progress
-                                progress = downloaded_size / total_size
-                                percentage = int(progress * 100)
-                                
-                                # Calculate speed
-                                time_diff = current_time - last_update_time
-                                bytes_diff = downloaded_size - last_downloaded
-                                speed_bps = bytes_diff / time_diff if time_diff > 0 else 0
-                                speed_text = self._format_speed(speed_bps)
+                        try:
+                            while not self.download_cancelled:
+                                n = raw.readinto(buffer)
+                                if not n:
+                                    break
                                 
-                                # Update UI on main thread (simpler lambda)
-                                def update_ui(p=progress, pct=percentage, spd=speed_text):
-                                    if not self.download_cancelled:
-                                        self._update_progress(p, pct, spd)
+                                f.write(buffer[:n])
+                                if hasher is not None:
+                                    hasher.update(buffer[:n])
+                                downloaded_size += n
                                 
-                                self.after(0, update_ui)
-                                
-                                # Update tracking variables
-                                last_update_time = current_time
-                                last_downloaded = downloaded_size
+                                # Update progress (like intenserp_updater - simple approach)
+                                # Each read is a whole block, so one clock read per block is cheap enough
+                                if total_size > 0:
+                                    current_time = time.monotonic()
+                                    
+                                    # Only update UI every 0.5 seconds to avoid flooding
+                                    if current_time - last_update_time >= 0.5:
+                                        # Calculate progress
+                                        progress = downloaded_size / total_size
+                                        percentage = int(progress * 100)
+                                        
+                                        # Calculate speed
+                                        time_diff = current_time - last_update_time
+                                        bytes_diff = downloaded_size - last_downloaded
+                                        speed_bps = bytes_diff / time_diff if time_diff > 0 else 0
+                                        speed_text = self._format_speed(speed_bps)
+                                        
+                                        # Publish for _poll_progress (a single assignment, safe across threads)
+                                        self._progress_state = (progress, percentage, speed_text)
+                                        
+                                        # Update tracking variables
+                                        last_update_time = current_time
+                                        last_downloaded = downloaded_size
+                        finally:
+                            # Drop any preallocated space the body didn't fill, even if the download failed
+                            f.truncate()
+            
+            if not self.download_cancelled and hasher is not None and hasher.hexdigest() != expected_sha256:
+                try:
+                    os.remove(download_path)
+                except OSError:
+                    pass
+                raise ValueError("Downloaded file failed SHA-256 verification. Please try again.")
             
             if not self.download_cancelled:
                 # Download completed successfully
-                self.after(0, lambda: self._download_completed(str(download_path)))
+                self.download_finished = True
+                self.after(0, partial(self._download_completed, str(download_path)))
             
         except Exception as e:
             if not self.download_cancelled:
-                self.after(0, lambda: self._download_error(str(e)))
+                self.download_finished = True
+                self.after(0, partial(self._download_error, str(e)))
+    
+    def _poll_progress(self):
+        """Apply the latest published progress on the main thread while the download runs"""
+        self._poll_after_id = None
+        if self.download_cancelled or self.download_finished:
+            return
+        
+        state = self._progress_state
+        if state is not None:
+            self._progress_state = None
+            self._update_progress(*state)
+        
+        self._poll_after_id = self.after(100, self._poll_progress)
     
     def _update_progress(self, progress: float, percentage: int, speed: str):
         """Update progress UI elements"""
-        self.progress_bar.set(progress)
-        self.percentage_label.configure(text=f"{percentage}%")
-        self.speed_label.configure(text=speed)
-        
-        # Show cancel button after 3 seconds
-        if percentage > 5:
+        # Each set/configure redraws a CTk canvas, so skip the ones that wouldn't change anything
+        if percentage != self._shown_percentage:
+            self._shown_percentage = percentage
+            self.progress_bar.set(progress)
+            self.percentage_label.configure(text=f"{percentage}%")
+        if speed != self._shown_speed:
+            self._shown_speed = speed
+            self.speed_label.configure(text=speed)
+        
+        # Show cancel button once the download is under way (grid it only once)
+        if percentage > 5 and not self._cancel_shown:
+            self._cancel_shown = True
             self.cancel_btn.grid(row=4, column=0, pady=(0, 20))
     
     def _format_speed(self, bytes_per_second: float) -> str:
         """Format download speed in human-readable format"""
-        if bytes_per_second < 1024:
-            return f"{bytes_per_second:.0f} B/s"
-        elif bytes_per_second < 1024 * 1024:
-            return f"{bytes_per_second / 1024:.1f} KB/s"
-        else:
-            return f"{bytes_per_second / (1024 * 1024):.1f} MB/s"
+        for scale, unit in _SPEED_UNITS:
+            if bytes_per_second >= scale:
+                return f"{bytes_per_second / scale:.1f} {unit}"
+        return f"{bytes_per_second:.0f} B/s"
     
     def _download_completed(self, download_path: str):
         """Handle successful download completion"""
@@ -2221,20 +2501,13 @@ class DownloadProgressWindow(ctk.CTkToplevel):
         
         # Update title
         self.title("Download Complete")
-        title_label = self.winfo_children()[0]
-        title_label.configure(text="Download Complete!")
+        self.title_label.configure(text="Download Complete!")
         
         # Hide cancel button
         self.cancel_btn.grid_remove()
         
         # Show completion message
-        completion_label = ctk.CTkLabel(
-            self,
-            text="Download completed successfully!",
-            font=get_font_tuple("Blinker", 12),
-            text_color=("green", "lightgreen")
-        )
-        completion_label.grid(row=4, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self._show_status("Download completed successfully!", ("green", "lightgreen"))
         
         # Handle updater extraction if applicable
         if self.asset.is_updater and self.asset.is_current_platform:
@@ -2246,16 +2519,11 @@ class DownloadProgressWindow(ctk.CTkToplevel):
         """Handle download error"""
         # Update UI to show error
         self.title("Download Failed")
-        title_label = self.winfo_children()[0]
-        title_label.configure(text="Download Failed")
+        self.title_label.configure(text="Download Failed")
         
-        error_label = ctk.CTkLabel(
-            self,
-            text=f"Error: {error_message}",
-            font=get_font_tuple("Blinker", 12),
-            text_color=("red", "red")
-        )
-        error_label.grid(row=4, column=0, padx=20, pady=(0, 10), sticky="ew")
+        # The cancel button shares the status row
+        self.cancel_btn.grid_remove()
+        self._show_status(f"Error: {error_message}", ("red", "red"))
         
         # Show close button
         close_btn = ctk.CTkButton(
@@ -2270,58 +2538,73 @@ class DownloadProgressWindow(ctk.CTkToplevel):
     def _handle_updater_extraction(self, download_path: str):
         """Extract and run updater for current platform"""
         # Show extraction status
-        extract_label = ctk.CTkLabel(
-            self,
-            text="Extracting updater...",
-            font=get_font_tuple("Blinker", 12),
-            text_color=("blue", "lightblue")
-        )
-        extract_label.grid(row=4, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self._show_status("Extracting updater...", ("blue", "lightblue"))
+        
+        # Permissions were verified in the background while downloading
+        if self._permission_future is None:
+            self._start_permission_check()
+        
+        deadline = time.monotonic() + _PERMISSION_CHECK_TIMEOUT
+        self._wait_for_permission_check(download_path, deadline)
+    
+    def _wait_for_permission_check(self, download_path: str, deadline: float):
+        """Poll the background permission check from the main thread instead of blocking on it"""
+        self._permission_after_id = None
+        if not self.winfo_exists():
+            return
+        
+        if not self._permission_future.done():
+            if time.monotonic() < deadline:
+                self._permission_after_id = self.after(50, self._wait_for_permission_check, download_path, deadline)
+            else:
+                self._show_status("Permission error: Permission check timed out", ("red", "red"))
+                self._show_completion_buttons()
+            return
         
+        self._run_updater_extraction(download_path)
+    
+    def _run_updater_extraction(self, download_path: str):
+        """Extract and run the updater once the permission check has finished"""
         try:
-            from .storage_manager import StorageManager
-            from .updater_manager import UpdaterManager
-            
-            storage_manager = StorageManager()
-            
-            # Verify permissions first
-            has_permissions, perm_message = UpdaterManager.verify_updater_permissions(storage_manager)
+            storage_mgr, (has_permissions, perm_message) = self._permission_future.result()
             if not has_permissions:
-                extract_label.configure(text=f"Permission error: {perm_message}", text_color=("red", "red"))
+                self._show_status(f"Permission error: {perm_message}", ("red", "red"))
                 self._show_completion_buttons()
                 return
             
             # Extract and run the updater
-            success, message = UpdaterManager.extract_and_run_updater(download_path, storage_manager)
+            success, message = UpdaterManager.extract_and_run_updater(download_path, storage_mgr)
             
             if success:
                 # Update status to show success
-                extract_label.configure(text="Starting updater...", text_color=("green", "lightgreen"))
+                self._show_status("Starting updater...", ("green", "lightgreen"))
                 
                 # Add informational message
-                info_label = ctk.CTkLabel(
-                    self,
-                    text="The updater will handle the rest of the installation.\nThis application will now close.",
-                    font=get_font_tuple("Blinker", 11),
-                    text_color=("gray50", "gray70")
+                self.info_label.configure(
+                    text="The updater will handle the rest of the installation.\nThis application will now close."
                 )
-                info_label.grid(row=5, column=0, padx=20, pady=(5, 10), sticky="ew")
+                self.info_label.grid()
                 
                 # Close this window and the main application after a short delay
                 self.after(2000, self._close_application)
             else:
                 # Show error message
-                extract_label.configure(text=f"Error: {message}", text_color=("red", "red"))
+                self._show_status(f"Error: {message}", ("red", "red"))
                 self._show_completion_buttons()
         
         except Exception as e:
-            extract_label.configure(text=f"Unexpected error: {str(e)}", text_color=("red", "red"))
+            self._show_status(f"Unexpected error: {str(e)}", ("red", "red"))
             self._show_completion_buttons()
     
+    def _show_status(self, text: str, text_color):
+        """Show a message in the shared status label"""
+        self.status_label.configure(text=text, text_color=text_color)
+        self.status_label.grid()
+    
     def _show_completion_buttons(self):
         """Show completion buttons"""
+        # Fill the frame before gridding it so it's laid out once, complete
         button_frame = ctk.CTkFrame(self, fg_color="transparent")
-        button_frame.grid(row=5, column=0, padx=20, pady=(0, 20), sticky="ew")
         button_frame.grid_columnconfigure(0, weight=1)
         button_frame.grid_columnconfigure(1, weight=1)
         
@@ -2344,25 +2627,24 @@ class DownloadProgressWindow(ctk.CTkToplevel):
             height=35
         )
         close_btn.grid(row=0, column=1, padx=(5, 0), sticky="ew")
+        
+        button_frame.grid(row=5, column=0, padx=20, pady=(0, 20), sticky="ew")
     
     def _open_download_folder(self):
         """Open the downloads folder"""
         try:
             if hasattr(self, 'final_download_path') and self.final_download_path:
-                import subprocess
-                import platform
-                
                 # Get the folder containing the downloaded file
                 folder_path = os.path.dirname(self.final_download_path)
                 
                 # Open folder in OS file manager
-                system = platform.system()
+                system = _SYSTEM
                 if system == "Windows":
                     os.startfile(folder_path)
                 elif system == "Darwin":  # macOS
-                    subprocess.run(["open", folder_path])
+                    self._spawn_detached(["open", folder_path])
                 elif system == "Linux":
-                    subprocess.run(["xdg-open", folder_path])
+                    self._spawn_detached(["xdg-open", folder_path])
                     
                 print(f"Opened download folder: {folder_path}")
             else:
@@ -2370,6 +2652,17 @@ class DownloadProgressWindow(ctk.CTkToplevel):
         except Exception as e:
             print(f"Error opening download folder: {e}")
     
+    @staticmethod
+    def _spawn_detached(command: List[str]) -> None:
+        """Launch a helper process without waiting for it (the click handler returns immediately)"""
+        subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True
+        )
+    
     def _close_application(self):
         """Close the entire application"""
         if self.parent:
@@ -2385,12 +2678,22 @@ class DownloadProgressWindow(ctk.CTkToplevel):
         # Ask user if they want to cancel
         self._cancel_download()
     
+    def destroy(self):
+        """Cancel the pending polls so they don't fire against a destroyed window"""
+        for after_id in (self._poll_after_id, self._permission_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._poll_after_id = self._permission_after_id = None
+        super().destroy()
+    
     def center(self):
         """Center the window relative to parent"""
-        self.update_idletasks()
         if self.parent:
-            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (self.winfo_width() // 2)
-            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (self.winfo_height() // 2)
+            # Use the known window size instead of flushing idle tasks to measure it
+            width = self._apply_window_scaling(self._window_width)
+            height = self._apply_window_scaling(self._window_height)
+            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (width // 2)
+            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (height // 2)
             self.geometry(f"+{x}+{y}")
 
 
@@ -2403,11 +2706,13 @@ class WelcomeWindow(ctk.CTkToplevel):
     
     def __init__(self, parent, version: str, icon_path: Optional[str] = None):
         super().__init__(parent)
+        self.withdraw()  # Build the widgets off-screen, then show the finished window once
         self.parent = parent
         self.version = version
         self.icon_path = icon_path
         self._create_window()
         self._create_widgets()
+        self.deiconify()
         
         # Set icon after a short delay to ensure window is ready
         if self.icon_path:
@@ -2416,17 +2721,21 @@ class WelcomeWindow(ctk.CTkToplevel):
     def _create_window(self):
         """Set up the window properties"""
         self.title("Welcome to IntenseRP Next!")
-        self.geometry("500x450")
+        self._window_width, self._window_height = 500, 450
+        self.geometry(f"{self._window_width}x{self._window_height}")
         self.resizable(False, False)
         
         # Configure grid weights
         self.grid_columnconfigure(0, weight=1)
-        for i in range(8):  # Adjust based on number of rows
+        for i in range(6):  # Adjust based on number of rows
             self.grid_rowconfigure(i, weight=0)
-        self.grid_rowconfigure(7, weight=1)  # Button area can expand
+        self.grid_rowconfigure(4, weight=1)  # Button area can expand
     
     def _create_widgets(self):
         """Create all widgets for the welcome screen"""
+        body_font = get_font_tuple("Blinker", 12)
+        body_bold_font = get_font_tuple("Blinker", 12, "bold")
+        
         # Title
         title_label = ctk.CTkLabel(
             self, 
@@ -2442,7 +2751,7 @@ class WelcomeWindow(ctk.CTkToplevel):
         welcome_label = ctk.CTkLabel(
             self,
             text=welcome_text,
-            font=get_font_tuple("Blinker", 12),
+            font=body_font,
             wraplength=460,
             justify="left"
         )
@@ -2457,69 +2766,26 @@ class WelcomeWindow(ctk.CTkToplevel):
         )
         getting_started_label.grid(row=2, column=0, padx=20, pady=(5, 5), sticky="ew")
         
-        # Step 1
-        step1_frame = ctk.CTkFrame(self, fg_color="transparent")
-        step1_frame.grid(row=3, column=0, padx=30, pady=2, sticky="ew")
-        step1_frame.grid_columnconfigure(1, weight=1)
-        
-        step1_bullet = ctk.CTkLabel(step1_frame, text="1.", font=get_font_tuple("Blinker", 12, "bold"), width=20)
-        step1_bullet.grid(row=0, column=0, sticky="w")
-        step1_text = ctk.CTkLabel(
-            step1_frame, 
-            text="Open Settings and configure the app to your liking",
-            font=get_font_tuple("Blinker", 12),
-            anchor="w"
-        )
-        step1_text.grid(row=0, column=1, sticky="w", padx=(5, 0))
-        
-        # Step 2
-        step2_frame = ctk.CTkFrame(self, fg_color="transparent")
-        step2_frame.grid(row=4, column=0, padx=30, pady=2, sticky="ew")
-        step2_frame.grid_columnconfigure(1, weight=1)
-        
-        step2_bullet = ctk.CTkLabel(step2_frame, text="2.", font=get_font_tuple("Blinker", 12, "bold"), width=20)
-        step2_bullet.grid(row=0, column=0, sticky="w")
-        step2_text = ctk.CTkLabel(
-            step2_frame, 
-            text="Visit our documentation website to learn more and get help faster",
-            font=get_font_tuple("Blinker", 12),
-            anchor="w"
-        )
-        step2_text.grid(row=0, column=1, sticky="w", padx=(5, 0))
-        
-        # Step 3
-        step3_frame = ctk.CTkFrame(self, fg_color="transparent")
-        step3_frame.grid(row=5, column=0, padx=30, pady=2, sticky="ew")
-        step3_frame.grid_columnconfigure(1, weight=1)
-        
-        step3_bullet = ctk.CTkLabel(step3_frame, text="3.", font=get_font_tuple("Blinker", 12, "bold"), width=20)
-        step3_bullet.grid(row=0, column=0, sticky="w")
-        step3_text = ctk.CTkLabel(
-            step3_frame, 
-            text="Need help? Contact the developer or report issues/start discussions",
-            font=get_font_tuple("Blinker", 12),
-            anchor="w"
+        # Static steps are rendered as one multi-line label rather than a widget per line
+        steps = (
+            "Open Settings and configure the app to your liking",
+            "Visit our documentation website to learn more and get help faster",
+            "Need help? Contact the developer or report issues/start discussions",
+            "⭐ Star the repository if you like the project!",
         )
-        step3_text.grid(row=0, column=1, sticky="w", padx=(5, 0))
-        
-        # Step 4
-        step4_frame = ctk.CTkFrame(self, fg_color="transparent")
-        step4_frame.grid(row=6, column=0, padx=30, pady=2, sticky="ew")
-        step4_frame.grid_columnconfigure(1, weight=1)
-        
-        step4_bullet = ctk.CTkLabel(step4_frame, text="4.", font=get_font_tuple("Blinker", 12, "bold"), width=20)
-        step4_bullet.grid(row=0, column=0, sticky="w")
-        step4_text = ctk.CTkLabel(
-            step4_frame, 
-            text="⭐ Star the repository if you like the project!",
-            font=get_font_tuple("Blinker", 12),
-            anchor="w"
+        steps_label = ctk.CTkLabel(
+            self,
+            text="\n".join(f"{i}.  {step_text}" for i, step_text in enumerate(steps, start=1)),
+            font=body_font,
+            justify="left",
+            anchor="w",
+            wraplength=440
         )
-        step4_text.grid(row=0, column=1, sticky="w", padx=(5, 0))
+        steps_label.grid(row=3, column=0, padx=30, pady=0, sticky="ew")
         
         # Buttons frame
         buttons_frame = ctk.CTkFrame(self, fg_color="transparent")
-        buttons_frame.grid(row=7, column=0, padx=20, pady=20, sticky="ew")
+        buttons_frame.grid(row=4, column=0, padx=20, pady=20, sticky="ew")
         buttons_frame.grid_columnconfigure(0, weight=1)
         buttons_frame.grid_columnconfigure(1, weight=1)
         buttons_frame.grid_columnconfigure(2, weight=1)
@@ -2528,7 +2794,7 @@ class WelcomeWindow(ctk.CTkToplevel):
         docs_btn = ctk.CTkButton(
             buttons_frame,
             text="Documentation",
-            font=get_font_tuple("Blinker", 12),
+            font=body_font,
             command=self._open_documentation,
             height=35
         )
@@ -2538,7 +2804,7 @@ class WelcomeWindow(ctk.CTkToplevel):
         github_btn = ctk.CTkButton(
             buttons_frame,
             text="GitHub",
-            font=get_font_tuple("Blinker", 12),
+            font=body_font,
             command=self._open_github,
             height=35
         )
@@ -2548,7 +2814,7 @@ class WelcomeWindow(ctk.CTkToplevel):
         continue_btn = ctk.CTkButton(
             buttons_frame,
             text="✨ Continue",
-            font=get_font_tuple("Blinker", 12, "bold"),
+            font=body_bold_font,
             command=self._continue_to_app,
             height=35
         )
@@ -2562,7 +2828,7 @@ class WelcomeWindow(ctk.CTkToplevel):
             text_color=("gray50", "gray50"),
             wraplength=450
         )
-        note_label.grid(row=8, column=0, padx=20, pady=(0, 10), sticky="ew")
+        note_label.grid(row=5, column=0, padx=20, pady=(0, 10), sticky="ew")
     
     def _open_documentation(self):
         """Open the documentation website"""
@@ -2586,10 +2852,12 @@ class WelcomeWindow(ctk.CTkToplevel):
     
     def center(self):
         """Center the window relative to parent"""
-        self.update_idletasks()
         if self.parent:
-            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (self.winfo_width() // 2)
-            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (self.winfo_height() // 2)
+            # Use the known window size instead of flushing idle tasks to measure it
+            width = self._apply_window_scaling(self._window_width)
+            height = self._apply_window_scaling(self._window_height)
+            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (width // 2)
+            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (height // 2)
             self.geometry(f"+{x}+{y}")
 
 
@@ -2598,19 +2866,27 @@ class GitUpdateDialog(ctk.CTkToplevel):
     
     def __init__(self, parent, icon_path: Optional[str] = None):
         super().__init__(parent)
+        self.withdraw()  # Build the widgets off-screen, then show the finished window once
         self.parent = parent
         self.icon_path = icon_path
         self._create_window()
         self._create_widgets()
+        self.deiconify()
         if self.icon_path:
             self.after(300, lambda: set_window_icon(self, self.icon_path))
     
     def _create_window(self):
         """Set up the window properties"""
         self.title("Update via Git")
-        self.geometry("450x300")
+        self._window_width, self._window_height = 450, 300
+        self.geometry(f"{self._window_width}x{self._window_height}")
         self.resizable(False, False)
-        self.attributes("-topmost", True)
+        if _SYSTEM == "Windows":
+            # transient() would drop the Mica backdrop (see make_window_modal)
+            self.attributes("-topmost", True)
+        else:
+            # Stay above the parent without asking the WM for global topmost
+            self.transient(self.parent)
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -2673,19 +2949,18 @@ class GitUpdateDialog(ctk.CTkToplevel):
         button_frame.grid_columnconfigure(0, weight=1)
         button_frame.grid_columnconfigure(1, weight=1)
         
-        # Run command button (if possible)
-        try:
-            import subprocess
-            run_btn = ctk.CTkButton(
-                button_frame,
-                text="Run Command",
-                command=self._run_git_pull,
-                font=get_font_tuple("Blinker", 12, "bold"),
-                height=35
-            )
-            run_btn.grid(row=0, column=0, padx=(0, 5), sticky="ew")
-        except ImportError:
-            pass
+        # Run command button
+        self.run_btn = ctk.CTkButton(
+            button_frame,
+            text="Run Command",
+            command=self._run_git_pull,
+            font=get_font_tuple("Blinker", 12, "bold"),
+            height=35
+        )
+        self.run_btn.grid(row=0, column=0, padx=(0, 5), sticky="ew")
+        
+        # Activity indicator shown in place of the run button while git is working
+        self.pull_progress = ctk.CTkProgressBar(button_frame, mode="indeterminate", height=10)
         
         # Close button
         close_btn = ctk.CTkButton(
@@ -2700,11 +2975,19 @@ class GitUpdateDialog(ctk.CTkToplevel):
         close_btn.grid(row=0, column=1, padx=(5, 0), sticky="ew")
     
     def _run_git_pull(self):
-        """Run git pull command"""
+        """Run git pull command in the background so the dialog stays responsive"""
+        self.run_btn.configure(state="disabled")
+        self.run_btn.grid_remove()
+        self.pull_progress.grid(row=0, column=0, padx=(0, 5), sticky="ew")
+        self.pull_progress.start()
+        
+        threading.Thread(target=self._git_pull_worker, daemon=True).start()
+    
+    def _git_pull_worker(self):
+        """Run git pull and hand the outcome back to the main thread"""
+        result = None
+        error = None
         try:
-            import subprocess
-            import os
-            
             # Get current working directory (should be the project root)
             project_dir = os.getcwd()
             
@@ -2712,41 +2995,54 @@ class GitUpdateDialog(ctk.CTkToplevel):
             result = subprocess.run(
                 ["git", "pull", "origin", "main"],
                 cwd=project_dir,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,  # Only stderr is ever shown
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=30
             )
-            
-            if result.returncode == 0:
-                # Success
-                from tkinter import messagebox
-                messagebox.showinfo(
-                    "Update Successful",
-                    "Git update completed successfully!\n\n"
-                    "Please restart the application to use the updated version."
-                )
-                self.destroy()
-                # Close the parent download options window too
-                if self.parent:
-                    self.parent.destroy()
-            else:
-                # Error
-                from tkinter import messagebox
-                messagebox.showerror(
-                    "Update Failed",
-                    f"Git update failed:\n\n{result.stderr}"
-                )
         except subprocess.TimeoutExpired:
-            from tkinter import messagebox
-            messagebox.showerror("Update Failed", "Git command timed out.")
+            error = "Git command timed out."
         except Exception as e:
-            from tkinter import messagebox
-            messagebox.showerror("Update Failed", f"Error running git command: {e}")
+            error = f"Error running git command: {e}"
+        
+        self.after(0, partial(self._git_pull_done, result, error))
+    
+    def _git_pull_done(self, result, error: Optional[str]):
+        """Report the git pull outcome"""
+        if not self.winfo_exists():
+            return
+        
+        self.pull_progress.stop()
+        self.pull_progress.grid_remove()
+        self.run_btn.configure(state="normal")
+        self.run_btn.grid()
+        
+        if error:
+            messagebox.showerror("Update Failed", error)
+        elif result.returncode == 0:
+            # Success
+            messagebox.showinfo(
+                "Update Successful",
+                "Git update completed successfully!\n\n"
+                "Please restart the application to use the updated version."
+            )
+            self.destroy()
+            # Close the parent download options window too
+            if self.parent:
+                self.parent.destroy()
+        else:
+            # Error
+            messagebox.showerror(
+                "Update Failed",
+                f"Git update failed:\n\n{result.stderr}"
+            )
     
     def center(self):
         """Center the window relative to parent"""
-        self.update_idletasks()
         if self.parent:
-            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (self.winfo_width() // 2)
-            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (self.winfo_height() // 2)
-            self.geometry(f"+{x}+{y}")
\ No newline at end of file
+            # Use the known window size instead of flushing idle tasks to measure it
+            width = self._apply_window_scaling(self._window_width)
+            height = self._apply_window_scaling(self._window_height)
+            x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (width // 2)
+            y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (height // 2)
+            self.geometry(f"+{x}+{y}")
\ No newline at end of file
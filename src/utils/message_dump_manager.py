@@ -4,8 +4,14 @@ Handles storage, comparison and cleanup of message dump files
 """
 
 import os
+import mmap
 import hashlib
-from typing import Optional
+from typing import Optional, Tuple
+
+
+# ASCII whitespace stripped from the ends of a dump file when hashing it in place,
+# anything else (Unicode whitespace, CR line endings) goes through a text-mode normalization
+_DUMP_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
 
 
 class MessageDumpManager:
@@ -32,6 +38,16 @@ class MessageDumpManager:
         self.msgdump_dir = os.path.join(self.base_path, "msgdump")
         self.old_dump_file = os.path.join(self.msgdump_dir, "olddump.txt")
         self.new_dump_file = os.path.join(self.msgdump_dir, "newdump.txt")
+        # Sidecar files holding the hash of each dump, so comparisons don't need to read the dump itself
+        self.old_hash_file = os.path.join(self.msgdump_dir, "olddump.hash")
+        self.new_hash_file = os.path.join(self.msgdump_dir, "newdump.hash")
+        
+        # (mtime_ns, size, hash) of olddump.txt as last seen, so an unchanged old dump isn't re-read
+        self._old_dump_cache: Optional[Tuple[int, int, str]] = None
+        # Hash of the content last written to newdump.txt
+        self._new_dump_hash: Optional[str] = None
+        # Set when the last compared message matched the old dump and newdump.txt was left alone
+        self._new_dump_is_old = False
     
     def _ensure_dump_directory_exists(self) -> None:
         """Create the msgdump directory if it doesn't exist"""
@@ -60,25 +76,104 @@ class MessageDumpManager:
             print(f"[color:yellow]Warning: Could not read dump file {filepath}: {e}")
             return None
     
-    def _write_dump_file(self, filepath: str, content: str) -> bool:
+    def _write_dump_file(self, filepath: str, content) -> bool:
         """Write content to a dump file
         
         Args:
             filepath: Path to the dump file
-            content: Content to write
+            content: Content to write (str, or bytes already encoded as UTF-8)
             
         Returns:
             True if successful, False otherwise
         """
         try:
             self._ensure_dump_directory_exists()
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            data = memoryview(content.encode('utf-8') if isinstance(content, str) else content)
+            
+            # Write the encoded bytes straight to the descriptor, no text layer (or newline translation)
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                written = 0
+                while written < len(data):
+                    written += os.write(fd, data[written:])
+            finally:
+                os.close(fd)
             return True
         except Exception as e:
             print(f"[color:red]Error writing dump file {filepath}: {e}")
             return False
     
+    @staticmethod
+    def _hash_dump_content(content) -> str:
+        """Hash normalized dump content for the sidecar files
+        
+        Args:
+            content: UTF-8 encoded dump content (bytes-like), already stripped
+            
+        Returns:
+            BLAKE2b hash as hex string
+        """
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+    
+    def _hash_dump_file(self, filepath: str) -> Optional[str]:
+        """Hash a dump file's stripped content by memory-mapping it
+        
+        Args:
+            filepath: Path to the dump file
+            
+        Returns:
+            BLAKE2b hash as hex string, or None if file doesn't exist or error occurs
+        """
+        try:
+            with open(filepath, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    # Empty files can't be mapped
+                    return self._hash_dump_content(b"")
+                
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    
+                    start, end = 0, size
+                    while start < end and mm[start] in _DUMP_WHITESPACE:
+                        start += 1
+                    while end > start and mm[end - 1] in _DUMP_WHITESPACE:
+                        end -= 1
+                    
+                    # Old dumps were read in text mode and str.strip()ped, which also drops Unicode
+                    # whitespace and translates CR line endings. Do the same when either could apply
+                    if (start < end and (mm[start] >= 0x80 or mm[end - 1] >= 0x80)) or mm.find(b"\r", start, end) != -1:
+                        text = mm[start:end].decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                        return self._hash_dump_content(text.strip().encode('utf-8'))
+                    
+                    # Hash straight from the mapping, the views must be released before it closes
+                    with memoryview(mm) as view, view[start:end] as content:
+                        return self._hash_dump_content(content)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[color:yellow]Warning: Could not read dump file {filepath}: {e}")
+            return None
+    
+    def _read_hash_file(self, filepath: str) -> Optional[str]:
+        """Read a dump hash sidecar file
+        
+        Args:
+            filepath: Path to the hash file
+            
+        Returns:
+            Stored hash, or None if the file doesn't exist or can't be read
+        """
+        try:
+            with open(filepath, 'r', encoding='ascii') as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[color:yellow]Warning: Could not read dump hash file {filepath}: {e}")
+            return None
+    
     def get_old_dump_content(self) -> Optional[str]:
         """Get the content of the old dump file
         
@@ -90,13 +185,26 @@ class MessageDumpManager:
     def set_new_dump_content(self, content: str) -> bool:
         """Set the content of the new dump file
         
+        Stores the stripped content along with its hash in newdump.hash
+        
         Args:
             content: Message content to store
             
         Returns:
             True if successful, False otherwise
         """
-        return self._write_dump_file(self.new_dump_file, content)
+        content_bytes = content.strip().encode('utf-8')
+        return self._store_new_dump(content_bytes, self._hash_dump_content(content_bytes))
+    
+    def _store_new_dump(self, content: bytes, content_hash: str) -> bool:
+        """Write already normalized content and its hash to the new dump files"""
+        self._new_dump_hash = None
+        self._new_dump_is_old = False
+        if (self._write_dump_file(self.new_dump_file, content)
+                and self._write_dump_file(self.new_hash_file, content_hash)):
+            self._new_dump_hash = content_hash
+            return True
+        return False
     
     def get_new_dump_content(self) -> Optional[str]:
         """Get the content of the new dump file
@@ -106,9 +214,50 @@ class MessageDumpManager:
         """
         return self._read_dump_file(self.new_dump_file)
     
+    def _matches_old_dump(self, new_bytes: bytes, new_hash: str) -> bool:
+        """Check whether normalized content is identical to the old dump
+        
+        Args:
+            new_bytes: UTF-8 encoded, stripped content
+            new_hash: Hash of new_bytes
+            
+        Returns:
+            True if the old dump holds the same content, False otherwise
+        """
+        try:
+            old_stat = os.stat(self.old_dump_file)
+        except FileNotFoundError:
+            # If no old content exists, they can't be identical
+            return False
+        
+        # A hash sidecar means the old dump was written stripped and in binary, so a size mismatch
+        # settles it. Older dumps may carry whitespace or CRLF line endings and have to be hashed
+        if os.path.exists(self.old_hash_file) and old_stat.st_size != len(new_bytes):
+            return False
+        
+        # Reuse the old dump's hash if the file hasn't changed since we last looked
+        cache = self._old_dump_cache
+        if cache and cache[0] == old_stat.st_mtime_ns and cache[1] == old_stat.st_size:
+            return cache[2] == new_hash
+        
+        # Compare hashes when the old dump has a sidecar, without reading the dump itself
+        old_hash = self._read_hash_file(self.old_hash_file)
+        if old_hash is None:
+            # Old dump predates hash files, hash its content in place instead of reading it into a string
+            old_hash = self._hash_dump_file(self.old_dump_file)
+        
+        # If no old content exists, they can't be identical
+        if old_hash is None:
+            return False
+        
+        self._old_dump_cache = (old_stat.st_mtime_ns, old_stat.st_size, old_hash)
+        return old_hash == new_hash
+    
     def compare_dumps(self, new_content: str) -> bool:
         """Compare new content with old dump content
         
+        The new content is only written to newdump.txt when it differs from the old dump
+        
         Args:
             new_content: New message content to compare
             
@@ -116,22 +265,24 @@ class MessageDumpManager:
             True if contents are identical, False otherwise
         """
         try:
-            # Write new content to newdump.txt
-            if not self.set_new_dump_content(new_content):
-                return False
-            
-            # Get old content
-            old_content = self.get_old_dump_content()
+            new_content_normalized = new_content.strip()
+            new_bytes = new_content_normalized.encode('utf-8')
+            new_hash = self._hash_dump_content(new_bytes)
             
-            # If no old content exists, they can't be identical
-            if old_content is None:
-                return False
+            try:
+                identical = self._matches_old_dump(new_bytes, new_hash)
+            except Exception as e:
+                print(f"[color:red]Error comparing dumps: {e}")
+                identical = False
             
-            # Compare contents (strip whitespace for accurate comparison)
-            new_content_normalized = new_content.strip()
-            old_content_normalized = old_content.strip()
+            if identical:
+                # The old dump already holds this message, so there's nothing to write or promote later
+                self._new_dump_is_old = True
+                return True
             
-            return new_content_normalized == old_content_normalized
+            # Write new content to newdump.txt, it becomes the old dump after a successful generation
+            self._store_new_dump(new_bytes, new_hash)
+            return False
             
         except Exception as e:
             print(f"[color:red]Error comparing dumps: {e}")
@@ -140,23 +291,43 @@ class MessageDumpManager:
     def update_dumps_after_success(self) -> bool:
         """Update dump files after successful generation
         
-        This moves newdump.txt content to olddump.txt for next comparison
+        This moves newdump.txt (and its hash) over olddump.txt for next comparison
         
         Returns:
             True if successful, False otherwise
         """
         try:
-            new_content = self.get_new_dump_content()
-            if new_content is None:
+            if self._new_dump_is_old:
+                # compare_dumps() found the message identical, olddump.txt is already current
+                self._new_dump_is_old = False
+                print("[color:cyan]Message dumps already up to date")
+                return True
+            
+            self._ensure_dump_directory_exists()
+            
+            # Rename instead of copying, the new dump already has the content we want
+            self._old_dump_cache = None
+            try:
+                os.replace(self.new_dump_file, self.old_dump_file)
+            except FileNotFoundError:
                 print("[color:yellow]Warning: No new dump content to update")
                 return False
             
-            # Move new content to old dump for next comparison
-            success = self._write_dump_file(self.old_dump_file, new_content)
-            if success:
-                print("[color:cyan]Message dumps updated successfully")
+            try:
+                os.replace(self.new_hash_file, self.old_hash_file)
+            except FileNotFoundError:
+                # New dump has no hash, don't let the previous one describe it
+                if os.path.exists(self.old_hash_file):
+                    os.remove(self.old_hash_file)
+            else:
+                if self._new_dump_hash is not None:
+                    # A rename keeps the mtime, so the cache matches the file we just moved
+                    old_stat = os.stat(self.old_dump_file)
+                    self._old_dump_cache = (old_stat.st_mtime_ns, old_stat.st_size, self._new_dump_hash)
+            self._new_dump_hash = None
             
-            return success
+            print("[color:cyan]Message dumps updated successfully")
+            return True
             
         except Exception as e:
             print(f"[color:red]Error updating dumps after success: {e}")
@@ -171,22 +342,30 @@ class MessageDumpManager:
             True if successful, False otherwise
         """
         try:
-            if os.path.exists(self.msgdump_dir):
-                # Remove all files in the directory
-                for filename in os.listdir(self.msgdump_dir):
-                    file_path = os.path.join(self.msgdump_dir, filename)
+            self._old_dump_cache = None
+            self._new_dump_hash = None
+            self._new_dump_is_old = False
+            
+            try:
+                entries = os.scandir(self.msgdump_dir)
+            except FileNotFoundError:
+                return True
+            
+            # Remove all files in the directory (scandir already knows each entry's type, no extra stat)
+            with entries:
+                for entry in entries:
                     try:
-                        if os.path.isfile(file_path):
-                            os.remove(file_path)
+                        if entry.is_file():
+                            os.remove(entry.path)
                     except Exception as e:
-                        print(f"[color:yellow]Warning: Could not remove {file_path}: {e}")
-                
-                # Remove the directory itself
-                try:
-                    os.rmdir(self.msgdump_dir)
-                    print("[color:green]Message dump directory cleaned successfully")
-                except Exception as e:
-                    print(f"[color:yellow]Warning: Could not remove msgdump directory: {e}")
+                        print(f"[color:yellow]Warning: Could not remove {entry.path}: {e}")
+            
+            # Remove the directory itself
+            try:
+                os.rmdir(self.msgdump_dir)
+                print("[color:green]Message dump directory cleaned successfully")
+            except Exception as e:
+                print(f"[color:yellow]Warning: Could not remove msgdump directory: {e}")
             
             return True
             
@@ -200,15 +379,31 @@ class MessageDumpManager:
         Returns:
             Dictionary with dump file status information
         """
+        status = {
+            'msgdump_dir_exists': False,
+            'msgdump_dir_path': self.msgdump_dir,
+            'old_dump_exists': False,
+            'new_dump_exists': False,
+            'old_dump_size': 0,
+            'new_dump_size': 0,
+        }
+        
+        # One directory listing instead of an exists/getsize probe per file
+        old_dump_name = os.path.basename(self.old_dump_file)
+        new_dump_name = os.path.basename(self.new_dump_file)
         try:
-            return {
-                'msgdump_dir_exists': os.path.exists(self.msgdump_dir),
-                'msgdump_dir_path': self.msgdump_dir,
-                'old_dump_exists': os.path.exists(self.old_dump_file),
-                'new_dump_exists': os.path.exists(self.new_dump_file),
-                'old_dump_size': os.path.getsize(self.old_dump_file) if os.path.exists(self.old_dump_file) else 0,
-                'new_dump_size': os.path.getsize(self.new_dump_file) if os.path.exists(self.new_dump_file) else 0,
-            }
+            with os.scandir(self.msgdump_dir) as entries:
+                status['msgdump_dir_exists'] = True
+                for entry in entries:
+                    if entry.name == old_dump_name:
+                        status['old_dump_exists'] = True
+                        status['old_dump_size'] = entry.stat().st_size
+                    elif entry.name == new_dump_name:
+                        status['new_dump_exists'] = True
+                        status['new_dump_size'] = entry.stat().st_size
+            return status
+        except FileNotFoundError:
+            return status
         except Exception as e:
             return {
                 'error': str(e),
@@ -216,16 +411,16 @@ class MessageDumpManager:
             }
     
     def generate_content_hash(self, content: str) -> str:
-        """Generate MD5 hash of content for debugging/logging
+        """Generate hash of content for debugging/logging
         
         Args:
             content: Content to hash
             
         Returns:
-            MD5 hash as hex string
+            BLAKE2b hash as hex string (same 32 characters as the MD5 it replaced)
         """
         try:
-            return hashlib.md5(content.encode('utf-8')).hexdigest()
+            return self._hash_dump_content(content.encode('utf-8'))
         except Exception:
             return "error_generating_hash"
 
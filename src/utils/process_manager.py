@@ -1,38 +1,51 @@
 import psutil, os
 
-def kill_driver_processes() -> None:
+_DRIVER_NAMES = frozenset({"chromedriver", "geckodriver", "msedgedriver", "uc_driver"})
+
+# Processes that can run cloudflared under their own name (shells and interpreters, "py" covers python and pypy).
+# Only these get their command line read, since that costs an extra read per process.
+_LAUNCHER_PREFIXES = ("py", "node", "sh", "bash", "zsh", "dash", "cmd", "powershell", "pwsh")
+
+def is_cloudflared_process(proc: psutil.Process) -> bool:
+    """Check whether a process from process_iter(['pid', 'name']) is cloudflared or runs it"""
+    try:
+        proc_name_lower = (proc.info['name'] or '').lower()
+        if 'cloudflared' in proc_name_lower:
+            return True
+        
+        # An unreadable name can't rule the process out, so only skip names that aren't launchers
+        if proc_name_lower and not proc_name_lower.startswith(_LAUNCHER_PREFIXES):
+            return False
+        
+        return any('cloudflared' in arg for arg in proc.cmdline())
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return False
+
+def _kill_matching_processes(drivers: bool, tunnels: bool) -> None:
+    """Terminate driver and/or cloudflared processes in a single pass over the process table"""
     for proc in psutil.process_iter(['pid', 'name']):
         try:
-            proc_name = proc.info['name']
-            base_name = os.path.splitext(proc_name)[0]
+            proc_name = proc.info['name'] or ''
             
-            if base_name in ["chromedriver", "geckodriver", "msedgedriver", "uc_driver"]:
+            if drivers and os.path.splitext(proc_name)[0] in _DRIVER_NAMES:
                 print(f"Terminating process: {proc_name} (PID: {proc.info['pid']})")
                 proc.terminate()
-        
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
-
-def kill_tunnel_processes() -> None:
-    """Clean up cloudflared tunnel processes"""
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        try:
-            proc_name = proc.info['name']
-            cmdline = proc.info.get('cmdline', [])
+                continue
             
-            # Look for cloudflared processes by name
-            if 'cloudflared' in proc_name.lower():
+            if tunnels and is_cloudflared_process(proc):
                 print(f"Terminating cloudflared process: {proc_name} (PID: {proc.info['pid']})")
                 proc.terminate()
-            # Also check for processes with cloudflared in command line arguments
-            elif cmdline and any('cloudflared' in str(arg) for arg in cmdline):
-                print(f"Terminating cloudflared-related process: {proc_name} (PID: {proc.info['pid']})")
-                proc.terminate()
         
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             continue
 
+def kill_driver_processes() -> None:
+    _kill_matching_processes(drivers=True, tunnels=False)
+
+def kill_tunnel_processes() -> None:
+    """Clean up cloudflared tunnel processes"""
+    _kill_matching_processes(drivers=False, tunnels=True)
+
 def kill_all_processes() -> None:
     """Clean up both driver and tunnel processes"""
-    kill_driver_processes()
-    kill_tunnel_processes()
\ No newline at end of file
+    _kill_matching_processes(drivers=True, tunnels=True)
\ No newline at end of file
@@ -6,10 +6,43 @@ Handles automatic page refresh when idle to prevent session timeouts
 import threading
 import time
 import random
+from dataclasses import dataclass
 from typing import Optional, Callable
 from core import get_state_manager
 
 
+@dataclass(frozen=True, slots=True)
+class RefreshTimerConfig:
+    """Parsed refresh timer settings, read once instead of on every timer tick"""
+    idle_timeout_minutes: int = 5
+    grace_period_seconds: int = 25
+    use_grace_period: bool = True
+    humanize_timing: bool = False
+    
+    @classmethod
+    def from_state(cls) -> "RefreshTimerConfig":
+        """Read and parse the refresh_timer.* settings from the state manager"""
+        state = get_state_manager()
+        
+        # Convert to int to handle string values from config
+        try:
+            idle_timeout_minutes = int(state.get_config_value("refresh_timer.idle_timeout", 5))
+        except (ValueError, TypeError):
+            idle_timeout_minutes = 5  # Default fallback
+        
+        try:
+            grace_period_seconds = int(state.get_config_value("refresh_timer.grace_period", 25))
+        except (ValueError, TypeError):
+            grace_period_seconds = 25  # Default fallback
+        
+        return cls(
+            idle_timeout_minutes=idle_timeout_minutes,
+            grace_period_seconds=grace_period_seconds,
+            use_grace_period=state.get_config_value("refresh_timer.use_grace_period", True),
+            humanize_timing=state.get_config_value("refresh_timer.humanize_timing", False),
+        )
+
+
 class RefreshTimer:
     """
     Manages automatic page refresh based on activity tracking.
@@ -23,11 +56,14 @@ class RefreshTimer:
     
     def __init__(self):
         self._lock = threading.RLock()
+        # Wakes the timer thread on activity, settings changes and stop
+        self._wakeup = threading.Condition(self._lock)
         self._timer_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
-        self._last_activity_time = time.time()
+        # Monotonic timestamps, only ever compared with each other
+        self._last_activity_time = time.monotonic()
         self._is_running = False
         self._in_grace_period = False
+        self._config: Optional[RefreshTimerConfig] = None
 
         # Callbacks
         self._refresh_callback: Optional[Callable] = None
@@ -44,10 +80,7 @@ class RefreshTimer:
         Returns:
             Randomized value that respects the minimum bound
         """
-        state = get_state_manager()
-        humanize_enabled = state.get_config_value("refresh_timer.humanize_timing", False)
-
-        if not humanize_enabled:
+        if not self._get_config().humanize_timing:
             return value
 
         # Apply ±5 second randomization
@@ -70,8 +103,8 @@ class RefreshTimer:
             
             self._refresh_callback = refresh_callback
             self._grace_period_start_callback = grace_period_start_callback
-            self._stop_event.clear()
-            self._last_activity_time = time.time()
+            self._config = RefreshTimerConfig.from_state()
+            self._last_activity_time = time.monotonic()
             self._in_grace_period = False
             self._is_running = True
             
@@ -88,16 +121,17 @@ class RefreshTimer:
                 return
             
             self._is_running = False
-            self._stop_event.set()
-            
-            # Wait for thread to finish
-            if self._timer_thread and self._timer_thread.is_alive():
-                self._timer_thread.join(timeout=2.0)
+            self._wakeup.notify_all()
             
+            timer_thread = self._timer_thread
             self._timer_thread = None
             self._in_grace_period = False
-            
-            print("[color:cyan]Refresh timer stopped")
+        
+        # Wait for thread to finish (outside the lock, the thread needs it to wake up)
+        if timer_thread and timer_thread.is_alive() and timer_thread is not threading.current_thread():
+            timer_thread.join(timeout=2.0)
+        
+        print("[color:cyan]Refresh timer stopped")
     
     def record_activity(self) -> None:
         """Record user activity, resetting the timer."""
@@ -106,17 +140,33 @@ class RefreshTimer:
                 return
             
             old_time = self._last_activity_time
-            self._last_activity_time = time.time()
+            self._last_activity_time = time.monotonic()
             
             # If we were in grace period, cancel it
             if self._in_grace_period:
                 self._in_grace_period = False
                 print("[color:yellow]Activity detected during grace period - refresh cancelled")
             
+            # Let the timer thread push its deadline back
+            self._wakeup.notify_all()
+            
             # Log activity for debugging (only if significant time has passed)
-            if time.time() - old_time > 10:  # More than 10 seconds since last activity
+            if self._last_activity_time - old_time > 10:  # More than 10 seconds since last activity
                 print(f"[color:blue]Activity recorded - refresh timer reset")
     
+    def refresh_config(self) -> None:
+        """Re-read the refresh timer settings (call after the configuration changes)."""
+        with self._lock:
+            self._config = RefreshTimerConfig.from_state()
+            self._wakeup.notify_all()
+    
+    def _get_config(self) -> RefreshTimerConfig:
+        """Get the cached settings, reading them if the timer hasn't cached any yet."""
+        config = self._config
+        if config is None:
+            config = self._config = RefreshTimerConfig.from_state()
+        return config
+    
     def is_running(self) -> bool:
         """Check if the refresh timer is currently running."""
         with self._lock:
@@ -133,24 +183,13 @@ class RefreshTimer:
             if not self._is_running:
                 return 0
             
-            state = get_state_manager()
-            # Convert to int/float to handle string values from config
-            try:
-                idle_timeout_minutes = int(state.get_config_value("refresh_timer.idle_timeout", 5))
-            except (ValueError, TypeError):
-                idle_timeout_minutes = 5  # Default fallback
-            
-            use_grace_period = state.get_config_value("refresh_timer.use_grace_period", True)
-            idle_timeout_seconds = idle_timeout_minutes * 60
-            time_since_activity = time.time() - self._last_activity_time
+            config = self._get_config()
+            idle_timeout_seconds = config.idle_timeout_minutes * 60
+            time_since_activity = time.monotonic() - self._last_activity_time
 
             if self._in_grace_period:
-                try:
-                    grace_period_seconds = int(state.get_config_value("refresh_timer.grace_period", 25))
-                except (ValueError, TypeError):
-                    grace_period_seconds = 25  # Default fallback
-                grace_period_seconds = self._apply_humanization(grace_period_seconds, 5)  # Min 5 seconds
-                grace_time_elapsed = time.time() - self._grace_period_start_time
+                grace_period_seconds = self._apply_humanization(config.grace_period_seconds, 5)  # Min 5 seconds
+                grace_time_elapsed = time.monotonic() - self._grace_period_start_time
                 return max(0, grace_period_seconds - grace_time_elapsed)
             else:
                 idle_timeout_seconds = self._apply_humanization(idle_timeout_seconds, 60)  # Min 1 minute
@@ -159,23 +198,26 @@ class RefreshTimer:
     def _timer_loop(self) -> None:
         """Main timer loop that runs in background thread."""
         try:
-            while not self._stop_event.is_set():
-                try:
-                    if self._should_refresh():
-                        self._perform_refresh()
-                        break  # Stop after refreshing
-                    
-                    # Check every 5 seconds (with humanization if enabled)
-                    check_interval = self._apply_humanization(5, 1)  # Min 1 second
-                    if self._stop_event.wait(timeout=float(check_interval)):
-                        break
-                        
-                except Exception as e:
-                    print(f"Error in refresh timer loop: {e}")
-                    # Continue the loop despite errors
-                    check_interval = self._apply_humanization(5, 1)  # Min 1 second
-                    if self._stop_event.wait(timeout=float(check_interval)):
+            while True:
+                with self._lock:
+                    if not self._is_running:
                         break
+                    
+                    try:
+                        if not self._should_refresh():
+                            # Sleep until the idle timeout or grace period could be up, activity wakes us early
+                            self._wakeup.wait(timeout=max(self.get_time_until_next_check(), 1.0))  # Min 1 second
+                            continue
+                            
+                    except Exception as e:
+                        print(f"Error in refresh timer loop: {e}")
+                        # Continue the loop despite errors
+                        self._wakeup.wait(timeout=5.0)
+                        continue
+                
+                # Refresh outside the lock so activity and stop calls aren't blocked by it
+                self._perform_refresh()
+                break  # Stop after refreshing
                         
         except Exception as e:
             print(f"Fatal error in refresh timer: {e}")
@@ -187,26 +229,14 @@ class RefreshTimer:
     def _should_refresh(self) -> bool:
         """Check if refresh should be triggered."""
         with self._lock:
-            state = get_state_manager()
-            
-            # Get configuration and convert to int/float to handle string values
-            try:
-                idle_timeout_minutes = int(state.get_config_value("refresh_timer.idle_timeout", 5))
-            except (ValueError, TypeError):
-                idle_timeout_minutes = 5  # Default fallback
-            
-            try:
-                grace_period_seconds = int(state.get_config_value("refresh_timer.grace_period", 25))
-            except (ValueError, TypeError):
-                grace_period_seconds = 25  # Default fallback
-            
-            # Check if grace period is enabled
-            use_grace_period = state.get_config_value("refresh_timer.use_grace_period", True)
+            config = self._get_config()
+            idle_timeout_minutes = config.idle_timeout_minutes
+            use_grace_period = config.use_grace_period
 
             idle_timeout_seconds = idle_timeout_minutes * 60
-            grace_period_seconds = self._apply_humanization(grace_period_seconds, 5)  # Min 5 seconds
+            grace_period_seconds = self._apply_humanization(config.grace_period_seconds, 5)  # Min 5 seconds
             idle_timeout_seconds = self._apply_humanization(idle_timeout_seconds, 60)  # Min 1 minute
-            time_since_activity = time.time() - self._last_activity_time
+            time_since_activity = time.monotonic() - self._last_activity_time
             
             if not self._in_grace_period:
                 # Check if idle timeout has been reached
@@ -218,7 +248,7 @@ class RefreshTimer:
                     else:
                         # Use grace period - enter grace period first
                         self._in_grace_period = True
-                        self._grace_period_start_time = time.time()
+                        self._grace_period_start_time = time.monotonic()
                         
                         print(f"[color:orange]Idle timeout reached ({idle_timeout_minutes} minutes) - starting {grace_period_seconds}s grace period")
                         
@@ -234,7 +264,7 @@ class RefreshTimer:
                         return False
             else:
                 # We're in grace period - check if it's expired
-                grace_time_elapsed = time.time() - self._grace_period_start_time
+                grace_time_elapsed = time.monotonic() - self._grace_period_start_time
                 if grace_time_elapsed >= grace_period_seconds:
                     print(f"[color:red]Grace period expired - triggering page refresh")
                     return True
@@ -255,7 +285,7 @@ class RefreshTimer:
         finally:
             # Reset timer state
             with self._lock:
-                self._last_activity_time = time.time()
+                self._last_activity_time = time.monotonic()
                 self._in_grace_period = False
 
 
@@ -305,6 +335,12 @@ def record_activity() -> None:
     timer.record_activity()
 
 
+def reload_refresh_timer_config() -> None:
+    """Re-read the settings of the global refresh timer."""
+    timer = get_refresh_timer()
+    timer.refresh_config()
+
+
 def is_refresh_timer_running() -> bool:
     """Check if the global refresh timer is running."""
     timer = get_refresh_timer()
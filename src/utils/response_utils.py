@@ -5,14 +5,27 @@ This file maintains backward compatibility while using the new architecture.
 
 from flask import jsonify, Response
 import time, json
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pipeline.message_pipeline import MessagePipeline, process_character_data, get_streaming_setting, get_deepseek_settings
 
+try:
+    import orjson  # Optional C JSON encoder, used for responses when installed
+except ImportError:
+    orjson = None
+
 __version__ = "2.7.0"
+_MODEL_ID = f"rp-intense-{__version__}"  # Kept in sync by set_version()
 
 # Global pipeline instance for backward compatibility
 _pipeline_instance: Optional[MessagePipeline] = None
 
+def set_version(version: str) -> None:
+    """Set the version reported in responses"""
+    global __version__, _MODEL_ID
+    __version__ = version
+    _MODEL_ID = f"rp-intense-{version}"
+
 def get_pipeline(config: Optional[Dict[str, Any]] = None) -> MessagePipeline:
     """Get or create pipeline instance"""
     global _pipeline_instance
@@ -51,13 +64,30 @@ def get_deepseek_search(put_data: dict) -> bool:
 # Response Creation Functions
 # =============================================================================================================================
 
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """Create a JSON response, serialized with orjson when available"""
+    if orjson is not None:
+        try:
+            return Response(orjson.dumps(payload), mimetype="application/json")
+        except TypeError:
+            pass  # e.g. lone surrogates in scraped text, which the stdlib encoder escapes
+    return jsonify(payload)
+
+def _json_string(value: Any) -> str:
+    """Serialize a value to a JSON string, with orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass  # e.g. lone surrogates in scraped text, which the stdlib encoder escapes
+    return json.dumps(value)
+
 def get_model() -> Response:
     """Get model information response"""
-    global __version__
-    return jsonify({
+    return _json_response({
         "object": "list",
         "data": [{
-            "id": f"rp-intense-{__version__}",
+            "id": _MODEL_ID,
             "object": "model",
             "created": int(time.time() * 1000)
         }]
@@ -65,12 +95,11 @@ def get_model() -> Response:
 
 def create_response_jsonify(text: str) -> Response:
     """Create JSON response"""
-    global __version__
-    return jsonify({
+    return _json_response({
         "id": "chatcmpl-intenserp",
         "object": "chat.completion",
         "created": int(time.time() * 1000),
-        "model": f"rp-intense-{__version__}",
+        "model": _MODEL_ID,
         "choices": [{
             "index": 0,
             "message": {"role": "assistant", "content": text},
@@ -78,16 +107,23 @@ def create_response_jsonify(text: str) -> Response:
         }]
     })
 
+# Streaming chunks only differ in timestamp, model and content, so the JSON around them is prebuilt
+# (same layout json.dumps gives the equivalent dict)
+_STREAM_CHUNK_HEAD = 'data: {"id": "chatcmpl-intenserp", "object": "chat.completion.chunk", "created": '
+_STREAM_CHUNK_TAIL = '}}]}\n\n'
+
+@lru_cache(maxsize=16)
+def _stream_chunk_model_part(model: str) -> str:
+    """JSON between the timestamp and the content of a streaming chunk for a model"""
+    return ', "model": ' + json.dumps(model) + ', "choices": [{"index": 0, "delta": {"content": '
+
+def format_streaming_chunk(text: str, model: str) -> str:
+    """Format a streaming response chunk, only serializing the content itself"""
+    return f"{_STREAM_CHUNK_HEAD}{int(time.time() * 1000)}{_stream_chunk_model_part(model)}{_json_string(text)}{_STREAM_CHUNK_TAIL}"
+
 def create_response_streaming(text: str) -> str:
     """Create streaming response chunk"""
-    global __version__
-    return "data: " + json.dumps({
-        "id": "chatcmpl-intenserp",
-        "object": "chat.completion.chunk",
-        "created": int(time.time() * 1000),
-        "model": f"rp-intense-{__version__}",
-        "choices": [{"index": 0, "delta": {"content": text}}]
-    }) + "\n\n"
+    return format_streaming_chunk(text, _MODEL_ID)
 
 def create_response(text: str, streaming: bool) -> Response:
     """Create appropriate response based on streaming setting"""
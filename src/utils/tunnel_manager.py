@@ -3,18 +3,39 @@ TryCloudflare tunnel management utilities
 Handles tunnel lifecycle, URL retrieval, and cleanup
 """
 
+import atexit
 import threading
-import time
 import subprocess
 import re
+import shutil
 import psutil
-from typing import Optional, Callable
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Callable, List
+from dataclasses import dataclass, replace
+from utils.process_manager import is_cloudflared_process
 
 
-@dataclass
+# Public URL cloudflared prints to stderr once a quick tunnel is up (quick tunnel hostnames are lowercase)
+_TUNNEL_URL_RE = re.compile(r'https://[a-z0-9-]+\.trycloudflare\.com', re.ASCII)
+
+# How long cloudflared gets to print the tunnel URL before startup is considered failed
+_TUNNEL_URL_TIMEOUT = 30.0
+
+
+class _CloudflaredExited(RuntimeError):
+    """Raised when cloudflared exits on its own, which isn't a failure to start the tunnel"""
+    pass
+
+
+@lru_cache(maxsize=1)
+def _resolve_cloudflared() -> Optional[str]:
+    """Find cloudflared in the system PATH, cached so tunnel restarts don't walk PATH again"""
+    return shutil.which("cloudflared")
+
+
+@dataclass(frozen=True)
 class TunnelInfo:
-    """Information about an active tunnel"""
+    """Snapshot of the tunnel state, replaced as a whole so readers never need the lock"""
     url: Optional[str] = None
     process: Optional[subprocess.Popen] = None
     thread: Optional[threading.Thread] = None
@@ -31,6 +52,12 @@ class TunnelManager:
         self._url_callback: Optional[Callable[[str], None]] = None
         self._error_callback: Optional[Callable[[str], None]] = None
         self._lock = threading.Lock()
+        # cloudflared processes started by this manager, so cleanup doesn't have to scan the whole system
+        self._spawned_processes: List[subprocess.Popen] = []
+        
+        # Stop the tunnel on exit while modules are still intact, __del__ may run too late for that
+        self._closed = False
+        atexit.register(self._safe_stop)
     
     def set_callbacks(self, url_callback: Optional[Callable[[str], None]] = None, 
                      error_callback: Optional[Callable[[str], None]] = None):
@@ -53,9 +80,6 @@ class TunnelManager:
                 self._notify_error("Tunnel is already active")
                 return False
             
-            self.tunnel_info.port = port
-            self.tunnel_info.error_message = None
-            
             # Start tunnel in background thread
             tunnel_thread = threading.Thread(
                 target=self._run_tunnel_process,
@@ -63,7 +87,7 @@ class TunnelManager:
                 name="TunnelManager"
             )
             
-            self.tunnel_info.thread = tunnel_thread
+            self.tunnel_info = replace(self.tunnel_info, port=port, error_message=None, thread=tunnel_thread)
             tunnel_thread.start()
             
             return True
@@ -74,12 +98,10 @@ class TunnelManager:
             print(f"Starting TryCloudflare tunnel for port {self.tunnel_info.port}...")
             
             # Use system cloudflared binary (cross-platform)
-            import shutil
-            import re
-            
-            # Find cloudflared in system PATH
-            cloudflared_binary = shutil.which("cloudflared")
+            cloudflared_binary = _resolve_cloudflared()
             if not cloudflared_binary:
+                # Don't remember the miss, cloudflared may be installed before the next attempt
+                _resolve_cloudflared.cache_clear()
                 raise RuntimeError("cloudflared not found in PATH. Please install cloudflared first.")
             
             print(f"Using cloudflared binary: {cloudflared_binary}")
@@ -95,27 +117,45 @@ class TunnelManager:
             )
             
             # Store process immediately for cleanup
-            self.tunnel_info.process = cloudflared
+            with self._lock:
+                self.tunnel_info = replace(self.tunnel_info, process=cloudflared)
+                self._spawned_processes.append(cloudflared)
             
-            # Parse tunnel URL from stderr
+            # Parse tunnel URL from stderr, bounded by time rather than line count.
+            # A blocking pipe read can't time out on every platform, so a watchdog terminates
+            # cloudflared at the deadline, which ends the stderr iteration with EOF.
             tunnel_url = None
-            url_pattern = re.compile(r'https://[a-zA-Z0-9\-]+\.trycloudflare\.com')
+            timed_out = threading.Event()
             
-            for _ in range(30):  # Give it 30 lines to find URL
-                line = cloudflared.stderr.readline()
-                if not line:
-                    break
-                    
+            def on_url_deadline():
+                timed_out.set()
+                cloudflared.terminate()
+            
+            url_deadline = threading.Timer(_TUNNEL_URL_TIMEOUT, on_url_deadline)
+            url_deadline.daemon = True
+            url_deadline.start()
+            
+            for line in cloudflared.stderr:
                 print(f"Cloudflared: {line.strip()}")
                 
-                url_match = url_pattern.search(line)
+                # Cheap substring check first, most lines are plain log output
+                if 'trycloudflare.com' not in line:
+                    continue
+                
+                url_match = _TUNNEL_URL_RE.search(line)
                 if url_match:
                     tunnel_url = url_match.group(0)
                     break
             
+            url_deadline.cancel()
+            
             if not tunnel_url:
+                if timed_out.is_set():
+                    raise RuntimeError(f"Failed to get tunnel URL from cloudflared within {_TUNNEL_URL_TIMEOUT:.0f} seconds")
+                
+                # stderr reached EOF on its own, so cloudflared has exited (terminate() is a no-op then)
                 cloudflared.terminate()
-                raise RuntimeError("Failed to get tunnel URL from cloudflared")
+                raise _CloudflaredExited(f"cloudflared exited (code {cloudflared.wait()}) before publishing a URL")
             
             # Create compatible URL structure to match expected interface
             from collections import namedtuple
@@ -123,31 +163,38 @@ class TunnelManager:
             tunnel_url = Urls(tunnel_url, f"http://127.0.0.1:20241/metrics", cloudflared)
             
             with self._lock:
-                self.tunnel_info.url = tunnel_url
-                self.tunnel_info.is_active = True
+                self.tunnel_info = replace(self.tunnel_info, url=tunnel_url, is_active=True)
             
             print(f"TryCloudflare tunnel established: {tunnel_url}")
             self._notify_url(tunnel_url.tunnel)
             
-            # Keep the tunnel alive by monitoring the process
-            while self.tunnel_info.is_active:
-                time.sleep(1)
+            # Block until cloudflared exits instead of polling, stop_tunnel() terminates it.
+            # Keep draining stderr meanwhile, a full pipe would stall cloudflared's logging.
+            for _ in cloudflared.stderr:
+                pass
+            return_code = cloudflared.wait()
+            
+            with self._lock:
+                exited_unexpectedly = self.tunnel_info.is_active
+            if exited_unexpectedly:
+                raise _CloudflaredExited(f"cloudflared exited unexpectedly (exit code {return_code})")
                 
         except ImportError as e:
             error_msg = "pycloudflared is not installed. Run: pip install pycloudflared"
             self._notify_error(error_msg)
             print(f"Tunnel error: {error_msg}")
         except Exception as e:
-            error_msg = f"Failed to start tunnel: {str(e)}"
+            # cloudflared dying on its own isn't a startup failure, report its exit as is
+            error_msg = str(e) if isinstance(e, _CloudflaredExited) else f"Failed to start tunnel: {str(e)}"
             with self._lock:
-                self.tunnel_info.error_message = error_msg
+                self.tunnel_info = replace(self.tunnel_info, error_message=error_msg)
             self._notify_error(error_msg)
             print(f"Tunnel error: {error_msg}")
             import traceback
             traceback.print_exc()
         finally:
             with self._lock:
-                self.tunnel_info.is_active = False
+                self.tunnel_info = replace(self.tunnel_info, is_active=False)
                 if not self.tunnel_info.error_message:
                     print("TryCloudflare tunnel stopped")
     
@@ -162,59 +209,68 @@ class TunnelManager:
             if not self.tunnel_info.is_active:
                 return True
             
-            self.tunnel_info.is_active = False
+            # Reset tunnel info
+            self.tunnel_info = replace(self.tunnel_info, is_active=False, url=None, process=None, error_message=None)
             
-            # Clean up any cloudflared processes
+            # Terminate the cloudflared processes we started, this also releases the tunnel thread blocked on them
             self._cleanup_cloudflared_processes()
             
-            # Reset tunnel info
-            self.tunnel_info.url = None
-            self.tunnel_info.process = None
-            self.tunnel_info.error_message = None
-            
             print("TryCloudflare tunnel stopped")
             return True
     
     def get_tunnel_url(self) -> Optional[str]:
         """Get the current tunnel URL"""
-        with self._lock:
-            return self.tunnel_info.url if self.tunnel_info.is_active else None
+        info = self.tunnel_info
+        return info.url if info.is_active else None
     
     def is_tunnel_active(self) -> bool:
         """Check if tunnel is currently active"""
-        with self._lock:
-            return self.tunnel_info.is_active
+        return self.tunnel_info.is_active
     
     def get_tunnel_status(self) -> dict:
         """Get complete tunnel status information"""
-        with self._lock:
-            return {
-                'active': self.tunnel_info.is_active,
-                'url': self.tunnel_info.url,
-                'port': self.tunnel_info.port,
-                'error': self.tunnel_info.error_message
-            }
+        info = self.tunnel_info
+        return {
+            'active': info.is_active,
+            'url': info.url,
+            'port': info.port,
+            'error': info.error_message
+        }
     
     def _cleanup_cloudflared_processes(self):
-        """Clean up any orphaned cloudflared processes"""
+        """Terminate the cloudflared processes started by this manager"""
+        still_running = []
+        for process in self._spawned_processes:
+            # Popen knows when its process has exited, so this never signals a reused PID
+            if process.poll() is not None:
+                continue
+            try:
+                print(f"Terminating cloudflared process (PID: {process.pid})")
+                process.terminate()
+                still_running.append(process)
+            except Exception as e:
+                print(f"Error terminating cloudflared process: {e}")
+        
+        # Keep anything that may not have exited yet for the next cleanup
+        self._spawned_processes = still_running
+    
+    def _cleanup_orphans(self):
+        """Clean up any orphaned cloudflared processes, including ones from earlier runs"""
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            # ad_value keeps an unreadable name from raising, so it just falls through to the cmdline check
+            targets = [proc for proc in psutil.process_iter(['pid', 'name'], ad_value='') if is_cloudflared_process(proc)]
+            
+            for proc in targets:
                 try:
-                    proc_name = proc.info['name']
-                    cmdline = proc.info.get('cmdline', [])
-                    
-                    # Look for cloudflared processes
-                    if 'cloudflared' in proc_name.lower():
-                        print(f"Terminating cloudflared process: {proc_name} (PID: {proc.info['pid']})")
-                        proc.terminate()
-                    
-                    # Also check for processes with cloudflared in command line
-                    elif cmdline and any('cloudflared' in arg for arg in cmdline):
-                        print(f"Terminating cloudflared-related process: {proc_name} (PID: {proc.info['pid']})")
-                        proc.terminate()
-                        
+                    print(f"Terminating cloudflared process: {proc.info['name']} (PID: {proc.info['pid']})")
+                    proc.terminate()
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     continue
+            
+            # Wait for all of them at once rather than leaving the terminations unchecked
+            _, alive = psutil.wait_procs(targets, timeout=3)
+            for proc in alive:
+                print(f"cloudflared process did not exit in time (PID: {proc.pid})")
                     
         except Exception as e:
             print(f"Error cleaning up cloudflared processes: {e}")
@@ -235,11 +291,14 @@ class TunnelManager:
             except Exception as e:
                 print(f"Error in tunnel error callback: {e}")
     
-    def __del__(self):
-        """Cleanup when manager is destroyed"""
+    def _safe_stop(self):
+        """Stop the tunnel at interpreter exit, safe to call more than once"""
+        if self._closed:
+            return
+        self._closed = True
         try:
             self.stop_tunnel()
-        except:
+        except BaseException:
             pass
 
 
@@ -258,7 +317,9 @@ def get_tunnel_manager() -> TunnelManager:
 def cleanup_tunnel_processes():
     """Utility function to clean up any orphaned tunnel processes"""
     manager = get_tunnel_manager()
-    manager._cleanup_cloudflared_processes()
+    with manager._lock:
+        manager._cleanup_cloudflared_processes()
+    manager._cleanup_orphans()
 
 
 def start_tunnel_for_api(port: int = 5000, url_callback: Optional[Callable[[str], None]] = None, 
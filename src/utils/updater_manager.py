@@ -7,15 +7,53 @@ Used by the better update system for seamless updating experience.
 """
 
 import os
+import stat
 import sys
 import platform
 import tempfile
 import zipfile
 import subprocess
+import shutil
+import shlex
+from functools import lru_cache
 from typing import Optional, Tuple, List
 from pathlib import Path
 
 
+# The platform can't change while we're running, so resolve it once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_UPDATER_NAME = "IntenseRP-Updater.exe" if _IS_WINDOWS else "IntenseRP-Updater"
+# The Linux build ships as "intenserp-updater", so names are matched case-insensitively
+_UPDATER_NAME_LOWER = _UPDATER_NAME.lower()
+_APP_EXE_NAME = "IntenseRP Next.exe" if _IS_WINDOWS else "intenserp-next"
+
+# Asset name keywords that mark an updater build for the current platform
+_PLATFORM_KEYWORDS = {
+    "windows": ("win32", "windows"),
+    "linux": ("linux",),
+    "darwin": ("darwin", "macos"),
+}.get(_SYSTEM.lower(), ())
+
+# Whether os.access can check against the effective user, which isn't available on Windows
+_ACCESS_CHECKS_EFFECTIVE_IDS = os.access in os.supports_effective_ids
+
+# Chunk size for streaming the updater out of the zip, the default copy buffer is far smaller
+_EXTRACT_BUFSIZE = 1 << 20
+
+# Largest uncompressed/compressed size ratio accepted for the updater (zip bomb guard)
+_MAX_COMPRESSION_RATIO = 100
+
+# Terminal emulators to open the updater in on Unix, in order of preference
+_TERMINALS = ("gnome-terminal", "xterm", "konsole", "x-terminal-emulator")
+
+
+@lru_cache(maxsize=1)
+def _find_terminal() -> Optional[str]:
+    """Find the first available terminal emulator in PATH without spawning any of them"""
+    return next((terminal for terminal in _TERMINALS if shutil.which(terminal)), None)
+
+
 class UpdaterManager:
     """Manages updater extraction and execution"""
     
@@ -42,32 +80,23 @@ class UpdaterManager:
             
             # Extract the updater
             with zipfile.ZipFile(download_path, 'r') as zip_ref:
-                # List all files to find the updater
-                file_list = zip_ref.namelist()
-                updater_files = [f for f in file_list if 'IntenseRP-Updater' in f and not f.endswith('/')]
+                # Stop at the first entry named like the updater, skipping directories and empty placeholders
+                updater_info = next((info for info in zip_ref.infolist()
+                                     if not info.is_dir() and info.file_size > 0
+                                     and info.filename.rsplit('/', 1)[-1].lower() == _UPDATER_NAME_LOWER), None)
                 
-                if not updater_files:
+                if not updater_info:
                     return False, "No updater executable found in the package"
                 
-                # Extract all files to base directory
-                zip_ref.extractall(base_path)
-            
-            # Find the extracted updater executable
-            updater_path = UpdaterManager._find_updater_executable(base_path)
-            
-            if not updater_path:
-                return False, "Updater executable not found after extraction"
-            
-            # Make executable on Unix systems
-            if platform.system() != "Windows":
-                os.chmod(updater_path, 0o755)
+                # An executable barely compresses, a huge ratio means a corrupted or malicious archive
+                if updater_info.file_size > _MAX_COMPRESSION_RATIO * max(updater_info.compress_size, 1):
+                    return False, "Updater package looks corrupted (suspicious compression ratio)"
+                
+                # Extract only the updater, it's a single-file build and the rest of the package is docs
+                updater_path = UpdaterManager._extract_member(zip_ref, updater_info, base_path, executable=True)
             
             # Get current executable path to pass to updater
-            current_exe_path = storage_manager.get_executable_path()
-            if platform.system() == "Windows":
-                current_exe_path = os.path.join(current_exe_path, "IntenseRP Next.exe")
-            else:
-                current_exe_path = os.path.join(current_exe_path, "intenserp-next")
+            current_exe_path = os.path.join(base_path, _APP_EXE_NAME)
             
             # Run the updater with automatic update parameters
             success, message = UpdaterManager._run_updater(updater_path, current_exe_path, True)
@@ -82,27 +111,36 @@ class UpdaterManager:
             return False, f"Extraction failed: {str(e)}"
     
     @staticmethod
-    def _find_updater_executable(base_path: str) -> Optional[str]:
+    def _extract_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, base_path: str, executable: bool = False) -> str:
         """
-        Find the updater executable in the given directory
+        Extract a single zip member, streaming it to disk in large chunks
         
         Args:
-            base_path: Directory to search for updater
+            zip_ref: Open zip file containing the member
+            info: Member to extract
+            base_path: Directory to extract into
+            executable: Mark the file executable on Unix systems
             
         Returns:
-            Path to updater executable or None if not found
+            Path of the extracted file
         """
-        updater_name = "IntenseRP-Updater.exe" if platform.system() == "Windows" else "IntenseRP-Updater"
+        # Same path sanitizing as ZipFile.extract: drop drive letters and empty, '.' and '..' components
+        arcname = os.path.splitdrive(info.filename.replace('/', os.sep))[1]
+        parts = [part for part in arcname.split(os.sep) if part not in ('', os.curdir, os.pardir)]
+        target_path = os.path.join(base_path, *parts)
+        
+        target_dir = os.path.dirname(target_path)
+        if target_dir:
+            os.makedirs(target_dir, exist_ok=True)
         
-        # Search recursively for the updater
-        for root, dirs, files in os.walk(base_path):
-            for file in files:
-                if file == updater_name:
-                    updater_path = os.path.join(root, file)
-                    if os.path.isfile(updater_path):
-                        return updater_path
+        with zip_ref.open(info) as src, open(target_path, 'wb', buffering=_EXTRACT_BUFSIZE) as dst:
+            shutil.copyfileobj(src, dst, _EXTRACT_BUFSIZE)
+            
+            # Set the mode through the open handle, no second lookup of the path
+            if executable and not _IS_WINDOWS:
+                os.fchmod(dst.fileno(), 0o755)
         
-        return None
+        return target_path
     
     @staticmethod
     def _run_updater(updater_path: str, exe_path: Optional[str] = None, auto_update: bool = False) -> Tuple[bool, str]:
@@ -118,14 +156,18 @@ class UpdaterManager:
             Tuple of (success: bool, message: str)
         """
         try:
-            # Verify the file exists and is executable
-            if not os.path.isfile(updater_path):
+            # Verify the file exists and is executable, one stat covers both checks
+            try:
+                st = os.stat(updater_path)
+            except FileNotFoundError:
+                return False, f"Updater file not found: {updater_path}"
+            
+            if not stat.S_ISREG(st.st_mode):
                 return False, f"Updater file not found: {updater_path}"
             
             # On Unix systems, check if file is executable
-            if platform.system() != "Windows":
-                if not os.access(updater_path, os.X_OK):
-                    return False, f"Updater is not executable: {updater_path}"
+            if not _IS_WINDOWS and not st.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH):
+                return False, f"Updater is not executable: {updater_path}"
             
             # Build command with arguments
             command = [updater_path]
@@ -134,36 +176,37 @@ class UpdaterManager:
             
             # Start the updater in a visible console window for user interaction
             try:
-                if platform.system() == "Windows":
+                if _IS_WINDOWS:
                     # On Windows, create a new console window
                     subprocess.Popen(command, 
                                    cwd=os.path.dirname(updater_path),
                                    creationflags=subprocess.CREATE_NEW_CONSOLE)
                 else:
-                    # On Unix systems, try to open in terminal
+                    # On Unix systems, try to open in terminal. Each launch gets its own session so
+                    # the updater isn't hung up along with us when the app exits mid-update.
+                    terminal = _find_terminal()
                     try:
-                        # Try common terminal emulators
-                        for terminal in ["gnome-terminal", "xterm", "konsole", "x-terminal-emulator"]:
-                            try:
-                                if len(command) > 1:
-                                    # With arguments, need to quote the command
-                                    command_str = " ".join(f'"{arg}"' if " " in arg else arg for arg in command)
-                                    subprocess.Popen([terminal, "-e", "bash", "-c", command_str], 
-                                                   cwd=os.path.dirname(updater_path))
-                                else:
-                                    subprocess.Popen([terminal, "-e", updater_path], 
-                                                   cwd=os.path.dirname(updater_path))
-                                break
-                            except FileNotFoundError:
-                                continue
+                        if terminal:
+                            if len(command) > 1:
+                                # With arguments, need to quote the command for the shell
+                                command_str = shlex.join(command)
+                                subprocess.Popen([terminal, "-e", "bash", "-c", command_str], 
+                                               cwd=os.path.dirname(updater_path),
+                                               start_new_session=True)
+                            else:
+                                subprocess.Popen([terminal, "-e", updater_path], 
+                                               cwd=os.path.dirname(updater_path),
+                                               start_new_session=True)
                         else:
                             # Fallback: run in background
                             subprocess.Popen(command, 
-                                           cwd=os.path.dirname(updater_path))
+                                           cwd=os.path.dirname(updater_path),
+                                           start_new_session=True)
                     except Exception:
                         # Final fallback
                         subprocess.Popen(command, 
-                                       cwd=os.path.dirname(updater_path))
+                                       cwd=os.path.dirname(updater_path),
+                                       start_new_session=True)
                 
                 return True, "Updater launched in new console window"
                 
@@ -188,21 +231,12 @@ class UpdaterManager:
         Returns:
             True if asset is compatible updater, False otherwise
         """
-        if 'updater' not in asset_name.lower():
-            return False
-        
-        current_platform = platform.system().lower()
         asset_lower = asset_name.lower()
+        if 'updater' not in asset_lower:
+            return False
         
         # Check platform compatibility
-        if current_platform == "windows":
-            return "win32" in asset_lower or "windows" in asset_lower
-        elif current_platform == "linux":
-            return "linux" in asset_lower
-        elif current_platform == "darwin":  # macOS
-            return "darwin" in asset_lower or "macos" in asset_lower
-        
-        return False
+        return any(keyword in asset_lower for keyword in _PLATFORM_KEYWORDS)
     
     @staticmethod
     def get_download_directory(storage_manager) -> str:
@@ -264,15 +298,19 @@ class UpdaterManager:
             base_path = storage_manager.get_executable_path()
             
             # Check write permissions to executable directory
+            if _ACCESS_CHECKS_EFFECTIVE_IDS:
+                # On POSIX the effective-ID access check is authoritative, no test file needed
+                if not os.access(base_path, os.W_OK, effective_ids=True):
+                    return False, f"No write permission to application directory: {base_path}"
+                return True, "Permissions verified"
+            
             if not os.access(base_path, os.W_OK):
                 return False, f"No write permission to application directory: {base_path}"
             
-            # Try creating a test file
-            test_file = os.path.join(base_path, "test_permissions.tmp")
+            # Confirm with a real file, os.access doesn't see Windows ACLs (removed again on close)
             try:
-                with open(test_file, 'w') as f:
-                    f.write("test")
-                os.remove(test_file)
+                with tempfile.NamedTemporaryFile(dir=base_path, prefix="test_permissions", suffix=".tmp"):
+                    pass
             except Exception:
                 return False, f"Unable to write to application directory: {base_path}"
             